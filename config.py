@@ -12,6 +12,8 @@ class Config:
     # Server settings
     SERVER_URL: str = "http://localhost:8000"
     SERVER_TIMEOUT: int = 10  # seconds
+    MAX_PARALLEL: int = 8  # Maximum concurrent requests to the server
+    STATUS_CACHE_TTL: float = 30.0  # seconds a successful status check is reused
     
     # Angle constraints
     MIN_ANGLE: float = 0.0
@@ -20,6 +22,7 @@ class Config:
     
     # Search strategy parameters
     WIDE_SCAN_STEP: float = 10.0  # Initial wide scan step size
+    MEDIUM_SCAN_STEP: float = 5.0  # Medium scan step (coarse-to-fine search)
     NARROW_SCAN_STEP: float = 1.0     # Fine scan around peak
     REFINEMENT_STEP: float = 0.1    # Final refinement step
     
@@ -27,6 +30,8 @@ class Config:
     MEDIUM_WINDOW: float = 30.0  # Degrees around wide peak
     FINE_WINDOW: float = 10.0    # Degrees around medium peak
     REFINEMENT_WINDOW: float = 2.0  # Degrees around fine peak
+    SEARCH_CACHE_ENABLED: bool = True  # Reuse angles already measured; False re-measures them (noisy servers)
+    ADAPTIVE_MIN_SNR: float = 10.0  # Wide-scan signal-to-noise ratio needed for golden-section refinement
     
     # Measurement settings
     MEASUREMENTS_PER_ANGLE: int = 1  # Repeat measurements for averaging
@@ -35,6 +40,7 @@ class Config:
     INITIAL_SIGMA_GUESS: float = 15.0  # Initial guess for Gaussian width
     INITIAL_BASELINE_GUESS: float = 2.0  # Initial guess for baseline
     INITIAL_AMPLITUDE_GUESS: float = 100.0  # Initial guess for amplitude
+    LINEARIZED_FIT_MIN_HEIGHT: float = 0.1  # Fraction of peak height used by the closed-form guess
     
     # Reliability
     MIN_DATA_POINTS_FOR_FIT: int = 10  # Minimum points needed for curve fitting
@@ -42,5 +48,11 @@ class Config:
     # Visualization
     PLOT_FILE_BASE_NAME: str = "calibration_results"
     PLOT_OUTPUT_DIR: str = "plots"
+    PLOT_FORMAT: str = "png"  # "png", or "svg"/"pdf" for faster vector output
     PLOT_DPI: int = 300
+    PLOT_PNG_COMPRESSION: int = 3  # zlib level (0-9); lower saves faster, slightly larger files
+    PLOT_CURVE_POINTS: int = 256  # Points drawn along the fitted curve
     FIGURE_SIZE: tuple[int, int] = (10, 6)
+    
+    # Logging
+    LOG_LEVEL: str = "WARNING"  # Use "DEBUG" to see search progress
@@ -2,12 +2,12 @@
 Entry point for the calibration application.
 """
 
+import logging
 import sys
 from src.api_client import MeasurementClient
 from src.calibration import CalibrationEngine, CalibrationResult
 from src.search_strategy import WideToNarrowSearch
 from src.curve_fitting import GaussianFitter
-from src.scatter_plot import ResultsPlotter
 from config import Config
 
 
@@ -35,6 +35,8 @@ def main() -> int:
     Returns:
         Exit code (0 - success, 1 - failure)
     """
+    logging.basicConfig(level=Config.LOG_LEVEL, format="%(levelname)s: %(message)s")
+    
     try:
         # Initialize components
         client = MeasurementClient(base_url=Config.SERVER_URL)
@@ -52,8 +54,9 @@ def main() -> int:
         # Print results to stdout
         print_results(result)
         
-        # Generate visualization
+        # Generate visualization (matplotlib is only imported once needed)
         print("\nGenerating plot...")
+        from src.scatter_plot import ResultsPlotter
         plotter = ResultsPlotter()
         plotter.plot_results(
             result,
@@ -7,48 +7,66 @@ I not write code like this for real.
 """
 
 import os
+from typing import Union
 
 import numpy as np
 import uvicorn
-from fastapi import FastAPI
-from scipy.stats import binom
+from fastapi import Body, FastAPI
 
 app = FastAPI()
+RNG = np.random.default_rng()
 
 
-def gaussian(x: float, mu: int, sigma: int, baseline: float, amplitude: int) -> float:
-    exponent = (-(((x - mu) / sigma) ** 2)) / 2
-    return baseline + (amplitude - baseline) * np.exp(exponent)
+def gaussian(
+    x: Union[float, np.ndarray], mu: int, sigma: int, baseline: float, amplitude: int
+) -> Union[float, np.ndarray]:
+    z = (x - mu) * (1.0 / sigma)
+    return baseline + (amplitude - baseline) * np.exp(-0.5 * z * z)
 
 
-def measure_response(x: float, num_measurements: int = 100) -> float:
+def measure_response(
+    x: Union[float, np.ndarray], num_measurements: int = 100
+) -> Union[int, list[int]]:
     theoretical_signal = gaussian(
-        x=x,
+        x=np.asarray(x, dtype=np.float64),
         mu=50,
         sigma=10,
         baseline=0.02,
         amplitude=1,
     )
 
-    return binom.rvs(n=num_measurements, p=theoretical_signal)
+    samples = RNG.binomial(n=num_measurements, p=theoretical_signal)
+    return np.asarray(samples).tolist()
 
 
 @app.get("/")
-def status() -> dict[str, str]:
+async def status() -> dict[str, str]:
     return {"status": "up"}
 
 
 @app.get("/measure/")
-def measure(angle: float = 0) -> float:
+async def measure(angle: float = 0) -> int:
     if angle < 0.0 or angle > 360.0:
         raise ValueError("Angle must be between 0 and 360 degrees.")
     return measure_response(angle)
 
 
+@app.post("/measure_batch/")
+async def measure_batch(angles: list[float] = Body(embed=True)) -> list[int]:
+    x = np.asarray(angles, dtype=np.float64)
+    if np.any((x < 0.0) | (x > 360.0)):
+        raise ValueError("Angle must be between 0 and 360 degrees.")
+    return measure_response(x)
+
+
 def main():
     port = int(os.environ.get("ASSESSMENT_PORT", 8000))
     host = os.environ.get("ASSESSMENT_HOST", "127.0.0.1")
-    uvicorn.run(app, host=host, port=port)
+    workers = int(os.environ.get("ASSESSMENT_WORKERS", 1))
+    if workers > 1:
+        uvicorn.run("server:app", host=host, port=port, workers=workers)
+    else:
+        uvicorn.run(app, host=host, port=port)
 
 
 if __name__ == "__main__":
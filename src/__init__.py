@@ -6,21 +6,38 @@ This package provides tools for calibrating measurement systems by:
 - Executing search strategies to find optimal parameters
 - Fitting Gaussian curves to measurement data
 - Visualizing results
+
+Public names are imported lazily on first access (PEP 562), so importing
+the package does not pull in requests, SciPy or matplotlib up front.
 """
 
-from src.api_client import MeasurementClient
-from src.calibration import CalibrationEngine, CalibrationResult
-from src.curve_fitting import GaussianFitter, GaussianParams
-from src.search_strategy import SearchStrategy, WideToNarrowSearch
-from src.scatter_plot import ResultsPlotter
-
-__all__ = [
-    'MeasurementClient',
-    'CalibrationEngine',
-    'CalibrationResult',
-    'GaussianFitter',
-    'GaussianParams',
-    'SearchStrategy',
-    'WideToNarrowSearch',
-    'ResultsPlotter',
-]
+import importlib
+
+_LAZY_IMPORTS = {
+    'MeasurementClient': 'src.api_client',
+    'CalibrationEngine': 'src.calibration',
+    'CalibrationResult': 'src.calibration',
+    'GaussianFitter': 'src.curve_fitting',
+    'GaussianParams': 'src.curve_fitting',
+    'SearchStrategy': 'src.search_strategy',
+    'MultiPhaseSearch': 'src.search_strategy',
+    'ScanPhase': 'src.search_strategy',
+    'WideToNarrowSearch': 'src.search_strategy',
+    'CoarseToFineSearch': 'src.search_strategy',
+    'AdaptiveSearch': 'src.search_strategy',
+    'ResultsPlotter': 'src.scatter_plot',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -5,8 +5,14 @@ This module handles all HTTP communication and provides a clean interface
 for making measurements.
 """
 
+import atexit
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import requests
-from typing import List
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional, Tuple
 from config import Config
 
 
@@ -24,32 +30,90 @@ class MeasurementClient:
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self._measurement_count = 0
+        self._count_lock = threading.Lock()
+        
+        # Measurements already taken, keyed by angle in units of ANGLE_PRECISION
+        self._cache: Dict[int, float] = {}
+        
+        # Last successful status response and when it was received
+        self._status: Optional[dict] = None
+        self._status_timestamp = 0.0
+        
+        # Pre-built endpoint URLs
+        self._status_url = f"{self.base_url}/"
+        self._measure_url = f"{self.base_url}/measure/"
+        self._measure_batch_url = f"{self.base_url}/measure_batch/"
+        
+        # Cleared once the server answers the batch endpoint with 404/405,
+        # so later batches skip the POST that is bound to fail
+        self._batch_supported = True
+        
+        # Persistent session so the TCP connection is reused (HTTP keep-alive)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=Config.MAX_PARALLEL,
+            pool_maxsize=Config.MAX_PARALLEL
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        atexit.register(self.close)
+    
+    def _status_probe(self) -> dict:
+        """
+        Fetch the server status, reusing a recent "up" response.
+        
+        Returns:
+            Status response from the server
+        
+        Raises:
+            requests.RequestException: If the API request fails
+        """
+        now = time.monotonic()
+        if self._status is not None and now - self._status_timestamp < Config.STATUS_CACHE_TTL:
+            return self._status
+        
+        response = self._session.get(
+            self._status_url,
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        data = response.json()
+        if data.get("status") == "up":
+            self._status, self._status_timestamp = data, now
+        return data
     
     def check_server_status(self) -> bool:
         """
         Check if the server is running and responsive.
         
+        A successful check is remembered for Config.STATUS_CACHE_TTL seconds,
+        so repeated checks do not each cost a round trip.
+        
         Returns:
             True if server is up, False otherwise
         """
         try:
-            response = requests.get(
-                f"{self.base_url}/",
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("status") == "up"
+            return self._status_probe().get("status") == "up"
         except requests.RequestException as e:
             print(f"Error checking server status: {e}")
             return False
     
-    def measure(self, angle: float) -> float:
+    @staticmethod
+    def _cache_key(angle: float) -> int:
+        """Map an angle onto the ANGLE_PRECISION grid used as cache key."""
+        return round(angle / Config.ANGLE_PRECISION)
+    
+    def measure(self, angle: float, use_cache: bool = True) -> float:
         """
         Take a single measurement at the specified angle.
         
+        Angles already measured (to within ANGLE_PRECISION) are served from
+        the in-memory cache and do not count as new measurements.
+        
         Args:
             angle: Angle in degrees (0.0 to 360.0)
+            use_cache: If False, always query the server for a fresh value
+                and leave the cache unchanged
             
         Returns:
             Measured voltage (0.0 to 100.0)
@@ -63,19 +127,194 @@ class MeasurementClient:
                 f"Angle must be between {Config.MIN_ANGLE} and {Config.MAX_ANGLE} degrees"
             )
         
+        key = self._cache_key(angle)
+        if use_cache and key in self._cache:
+            return self._cache[key]
+        
         try:
-            response = requests.get(
-                f"{self.base_url}/measure",
+            response = self._session.get(
+                self._measure_url,
                 params={"angle": angle},
                 timeout=self.timeout
             )
             response.raise_for_status()
             measurement = float(response.json())
-            self._measurement_count += 1
+            with self._count_lock:
+                self._measurement_count += 1
+            if use_cache:
+                self._cache[key] = measurement
             return measurement
         except requests.RequestException as e:
             raise requests.RequestException(f"Error measuring at angle {angle}: {e}")
     
+    def measure_with_averaging(self, angle: float, 
+                               num_samples: int = Config.MEASUREMENTS_PER_ANGLE) -> float:
+        """
+        Take the average of several measurements at the specified angle.
+        
+        All samples are fresh readings taken in a single `measure_many`
+        request, so no server-side averaging support is needed and servers
+        without the batch endpoint fall back to one request per sample.
+        Averaged readings bypass the cache.
+        
+        Args:
+            angle: Angle in degrees (0.0 to 360.0)
+            num_samples: Number of measurements to average
+        
+        Returns:
+            Average measured voltage (0.0 to 100.0)
+        
+        Raises:
+            ValueError: If angle is out of valid range or num_samples < 1
+            requests.RequestException: If the API request fails
+        """
+        if num_samples == 1:
+            return self.measure(angle)
+        if num_samples < 1:
+            raise ValueError(f"num_samples must be at least 1, got {num_samples}")
+        
+        samples = self.measure_many(np.full(num_samples, angle, dtype=float), use_cache=False)
+        return float(samples.mean())
+    
+    def measure_many(self, angles: np.ndarray, use_cache: bool = True) -> np.ndarray:
+        """
+        Take one measurement at each of the given angles in a single request.
+        
+        Only angles missing from the cache are sent to the server. Servers
+        without the batch endpoint are handled by falling back to
+        `measure_parallel`.
+        
+        Args:
+            angles: Angles in degrees (0.0 to 360.0)
+            use_cache: If False, take a fresh reading for every entry of
+                `angles` (repeated angles included) and leave the cache
+                unchanged
+        
+        Returns:
+            Array of measurements in the order of `angles`
+        
+        Raises:
+            ValueError: If any angle is out of valid range
+            requests.RequestException: If the API request fails
+        """
+        angles = np.asarray(angles, dtype=float)
+        if np.any((angles < Config.MIN_ANGLE) | (angles > Config.MAX_ANGLE)):
+            raise ValueError(
+                f"Angle must be between {Config.MIN_ANGLE} and {Config.MAX_ANGLE} degrees"
+            )
+        
+        if not use_cache:
+            return np.array(self._fetch_batch(angles.tolist(), use_cache=False), dtype=float)
+        
+        keys = [self._cache_key(angle) for angle in angles.tolist()]
+        missing: Dict[int, float] = {}
+        for key, angle in zip(keys, angles.tolist()):
+            if key not in self._cache:
+                missing.setdefault(key, angle)
+        
+        if missing:
+            measurements = self._fetch_batch(list(missing.values()))
+            self._cache.update(zip(missing.keys(), measurements))
+        
+        return np.fromiter((self._cache[key] for key in keys), dtype=float, count=len(keys))
+    
+    def measure_batch(self, angles: List[float]) -> List[Tuple[float, float]]:
+        """
+        Take one measurement at each of the given angles in a single request.
+        
+        Same as `measure_many`, with the results paired with their angles.
+        
+        Args:
+            angles: Angles in degrees (0.0 to 360.0)
+        
+        Returns:
+            List of (angle, measurement) tuples in the order of `angles`
+        
+        Raises:
+            ValueError: If any angle is out of valid range
+            requests.RequestException: If the API request fails
+        """
+        angles = [float(angle) for angle in angles]
+        return list(zip(angles, self.measure_many(angles).tolist()))
+    
+    def _fetch_batch(self, angles: List[float], use_cache: bool = True) -> List[float]:
+        """
+        Measure the given angles on the server.
+        
+        A single angle, or any batch on a server known to lack the batch
+        endpoint, is measured with plain `/measure` requests.
+        
+        Args:
+            angles: Angles to measure
+            use_cache: Passed on to `measure` / `measure_parallel` when the
+                batch endpoint is not used
+        
+        Returns:
+            Measurements in the order of `angles`
+        
+        Raises:
+            requests.RequestException: If the API request fails
+        """
+        if len(angles) == 1:
+            return [self.measure(angles[0], use_cache=use_cache)]
+        if not self._batch_supported:
+            return self._fetch_parallel(angles, use_cache)
+        
+        try:
+            response = self._session.post(
+                self._measure_batch_url,
+                json={"angles": angles},
+                timeout=self.timeout
+            )
+            if response.status_code in (404, 405):
+                # Batch endpoint not available on this server
+                self._batch_supported = False
+                return self._fetch_parallel(angles, use_cache)
+            response.raise_for_status()
+            measurements = [float(value) for value in response.json()]
+        except requests.RequestException as e:
+            raise requests.RequestException(f"Error measuring batch of {len(angles)} angles: {e}")
+        
+        with self._count_lock:
+            self._measurement_count += len(angles)
+        return measurements
+    
+    def _fetch_parallel(self, angles: List[float], use_cache: bool) -> List[float]:
+        """Measure angles with concurrent single requests, returning the values only."""
+        return [measurement for _, measurement in self.measure_parallel(angles, use_cache=use_cache)]
+    
+    def measure_parallel(self, angles: List[float],
+                         max_workers: int = Config.MAX_PARALLEL,
+                         use_cache: bool = True) -> List[Tuple[float, float]]:
+        """
+        Measure independent angles concurrently with one request per angle.
+        
+        Requests run on a thread pool sharing the client's session; the GIL
+        is released while waiting on sockets, so wall-clock time approaches
+        one round trip per `max_workers` angles.
+        
+        Args:
+            angles: Angles in degrees (0.0 to 360.0)
+            max_workers: Maximum number of concurrent requests
+            use_cache: Passed on to `measure` for every angle
+        
+        Returns:
+            List of (angle, measurement) tuples in the order of `angles`
+        
+        Raises:
+            ValueError: If any angle is out of valid range
+            requests.RequestException: If any API request fails
+        """
+        angles = [float(angle) for angle in angles]
+        if not angles:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            measurements = list(executor.map(
+                lambda angle: self.measure(angle, use_cache=use_cache), angles
+            ))
+        return list(zip(angles, measurements))
+    
     @property
     def total_measurements(self) -> int:
         """Get the total number of measurements taken."""
@@ -84,3 +323,11 @@ class MeasurementClient:
     def reset_count(self) -> None:
         """Reset the measurement counter."""
         self._measurement_count = 0
+    
+    def clear_cache(self) -> None:
+        """Forget all cached measurements."""
+        self._cache.clear()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
@@ -88,12 +88,13 @@ class CalibrationEngine:
         # Execute search strategy to collect measurements
         print("\nExecute search strategy...")
         self.client.reset_count()
+        self.client.clear_cache()  # Samples from earlier runs must not be reused
         search_result = self.strategy.search(self.client)
         print(f"Search complete: {search_result.total_measurements} measurements taken")
         
-        # Convert to numpy arrays for fitting
-        angles = np.array(search_result.angles)
-        measurements = np.array(search_result.measurements)
+        # Search history is already stored as numpy arrays
+        angles = search_result.angles
+        measurements = search_result.measurements
         
         # Step 4: Fit Gaussian curve to the data
         print("\nFit Gaussian curve to data...")
@@ -109,9 +110,9 @@ class CalibrationEngine:
         optimal_angle = self.fitter.find_peak(fitted_params)
         print(f"Optimal angle: {optimal_angle:.1f}°")
         
-        # Take actual measurement at optimal angle for verification
+        # Take a fresh measurement at optimal angle for verification
         print("\nVerifying optimal angle...")
-        measured_voltage = self.client.measure(optimal_angle)
+        measured_voltage = self.client.measure(optimal_angle, use_cache=False)
         expected_voltage = self.fitter.predict(optimal_angle, fitted_params)
         print(f"Measured voltage: {measured_voltage:.2f}")
         print(f"Expected voltage: {expected_voltage:.2f}")
@@ -6,12 +6,30 @@ determining the optimal angle from the fitted parameters.
 """
 
 from dataclasses import dataclass
+import functools
+import math
 import numpy as np
 from scipy.optimize import curve_fit
-from typing import Tuple
+from typing import List, Optional, Tuple, Union
 from config import Config
 
 
+@functools.lru_cache(maxsize=4)
+def _plot_grid(num_points: int) -> np.ndarray:
+    """
+    Evenly spaced angles across the valid range, built once per size.
+    
+    Args:
+        num_points: Number of points in the grid
+    
+    Returns:
+        Read-only array of angles from MIN_ANGLE to MAX_ANGLE
+    """
+    angles = np.linspace(Config.MIN_ANGLE, Config.MAX_ANGLE, num_points)
+    angles.setflags(write=False)
+    return angles
+
+
 @dataclass
 class GaussianParams:
     """Parameters for a Gaussian curve."""
@@ -29,23 +47,138 @@ class GaussianFitter:
     """Fits Gaussian curves to measurement data."""
     
     @staticmethod
-    def gaussian_function(x: np.ndarray, mu: float, sigma: float, 
-                         baseline: float, amplitude: float) -> np.ndarray:
+    def gaussian_function(x: Union[float, np.ndarray], mu: float, sigma: float, 
+                         baseline: float, amplitude: float) -> Union[float, np.ndarray]:
         """
         Gaussian function for curve fitting.
         
         Args:
-            x: Input values (angles)
+            x: Input values (angles), array or scalar
             mu: Mean (center)
             sigma: Standard deviation (width)
             baseline: Baseline value
             amplitude: Peak amplitude
             
         Returns:
-            Gaussian function values
+            Gaussian function values, a scalar for scalar x
+        """
+        # Evaluate in place on a single buffer (a copy of x, so scalars
+        # become 0-d arrays) to avoid one temporary array per arithmetic step
+        values = np.array(x, dtype=np.float64)
+        values -= mu
+        values *= 1.0 / sigma
+        np.square(values, out=values)
+        values *= -0.5
+        np.exp(values, out=values)
+        values *= amplitude - baseline
+        values += baseline
+        return values if values.ndim else values[()]
+    
+    @staticmethod
+    def _scalar_gaussian(x: float, mu: float, sigma: float, 
+                         baseline: float, amplitude: float) -> float:
+        """
+        Gaussian function for a single angle, without array overhead.
+        
+        Args:
+            x: Input value (angle)
+            mu: Mean (center)
+            sigma: Standard deviation (width)
+            baseline: Baseline value
+            amplitude: Peak amplitude
+        
+        Returns:
+            Gaussian function value
+        """
+        exponent = -((x - mu) ** 2) / (2 * sigma * sigma)
+        return baseline + (amplitude - baseline) * math.exp(exponent)
+    
+    @staticmethod
+    def _gaussian_jac(x: np.ndarray, mu: float, sigma: float, 
+                      baseline: float, amplitude: float) -> np.ndarray:
+        """
+        Analytic Jacobian of `gaussian_function` for curve fitting.
+        
+        Args:
+            x: Input values (angles)
+            mu: Mean (center)
+            sigma: Standard deviation (width)
+            baseline: Baseline value
+            amplitude: Peak amplitude
+        
+        Returns:
+            Array of shape (len(x), 4) with the partial derivatives with
+            respect to mu, sigma, baseline and amplitude
         """
-        exponent = -((x - mu) ** 2) / (2 * sigma ** 2)
-        return baseline + (amplitude - baseline) * np.exp(exponent)
+        # Column-major so every column is a contiguous buffer that the
+        # partial derivatives are written into in place
+        jac = np.empty((np.size(x), 4), order='F')
+        d_mu, d_sigma, d_baseline, d_amplitude = jac.T
+        inv_var = 1.0 / (sigma * sigma)
+        offset = np.subtract(x, mu, dtype=np.float64)
+        
+        np.multiply(offset, offset, out=d_amplitude)
+        d_amplitude *= -0.5 * inv_var
+        np.exp(d_amplitude, out=d_amplitude)
+        
+        np.multiply(d_amplitude, offset, out=d_mu)
+        d_mu *= (amplitude - baseline) * inv_var
+        np.multiply(d_mu, offset, out=d_sigma)
+        d_sigma *= 1.0 / sigma
+        np.subtract(1.0, d_amplitude, out=d_baseline)
+        return jac
+    
+    @staticmethod
+    def _linearized_guess(angles: np.ndarray, measurements: np.ndarray,
+                          baseline: Optional[float] = None,
+                          peak: Optional[float] = None) -> Optional[List[float]]:
+        """
+        Closed-form estimate of the Gaussian parameters.
+        
+        Above the baseline, the logarithm of a Gaussian is a parabola, so
+        fitting log(measurements - baseline) with a quadratic via linear
+        least squares yields mu, sigma and amplitude in a single solve.
+        
+        Args:
+            angles: Array of angles
+            measurements: Array of corresponding measurements
+            baseline: Minimum of measurements, if already known
+            peak: Maximum of measurements, if already known
+        
+        Returns:
+            [mu, sigma, baseline, amplitude], or None if the data does not
+            describe a peak
+        """
+        angles = np.asarray(angles, dtype=np.float64)
+        measurements = np.asarray(measurements, dtype=np.float64)
+        
+        if baseline is None:
+            baseline = np.min(measurements)
+        if peak is None:
+            peak = np.max(measurements)
+        heights = measurements - baseline
+        # Points close to the baseline are dominated by noise once logged
+        mask = heights > Config.LINEARIZED_FIT_MIN_HEIGHT * (peak - baseline)
+        if np.count_nonzero(mask) < 3:
+            return None
+        
+        # Center the angles to keep the quadratic system well conditioned
+        center = np.mean(angles[mask])
+        x = angles[mask] - center
+        y = np.log(heights[mask])
+        design = np.column_stack([np.ones_like(x), x, x * x])
+        (a0, a1, a2), *_ = np.linalg.lstsq(design, y, rcond=None)
+        
+        if not a2 < 0:
+            return None
+        
+        mu = center - a1 / (2 * a2)
+        sigma = np.sqrt(-1 / (2 * a2))
+        amplitude = np.exp(a0 - a1 ** 2 / (4 * a2)) + baseline
+        guess = [mu, sigma, baseline, amplitude]
+        if not np.all(np.isfinite(guess)):
+            return None
+        return [float(value) for value in guess]
     
     def fit(self, angles: np.ndarray, measurements: np.ndarray) -> GaussianParams:
         """
@@ -67,45 +200,62 @@ class GaussianFitter:
                 f"Need at least {Config.MIN_DATA_POINTS_FOR_FIT}, got {len(angles)}"
             )
         
-        # Initial parameter guesses
+        # Heuristic initial parameter guesses; the peak value is read at the
+        # argmax index instead of scanning the data a second time
         max_idx = np.argmax(measurements)
         mu_guess = angles[max_idx]
-        amplitude_guess = np.max(measurements)
+        amplitude_guess = measurements[max_idx]
         baseline_guess = np.min(measurements)
         sigma_guess = Config.INITIAL_SIGMA_GUESS
         
-        initial_guess = [mu_guess, sigma_guess, baseline_guess, amplitude_guess]
+        heuristic_guess = [mu_guess, sigma_guess, baseline_guess, amplitude_guess]
         
-        # Set bounds for parameters
+        # Set bounds for parameters. These also keep mu within
+        # [MIN_ANGLE, MAX_ANGLE] and sigma positive, so the fitted values
+        # are used as-is; revisit the result handling below if they change.
         bounds = (
             [Config.MIN_ANGLE, 1.0, -10.0, 0.0],  # Lower bounds
             [Config.MAX_ANGLE, 50.0, 50.0, 110.0]  # Upper bounds
         )
         
-        try:
-            # Perform curve fitting
-            params, _ = curve_fit(
-                self.gaussian_function,
-                angles,
-                measurements,
-                p0=initial_guess,
-                bounds=bounds,
-                maxfev=10000
-            )
-            
-            mu, sigma, baseline, amplitude = params
-            
-            # Normalize mu to be within [0, 360]
-            mu = mu % 360.0
-            
-            return GaussianParams(
-                mu=mu,
-                sigma=abs(sigma),  # Ensure positive sigma
-                baseline=baseline,
-                amplitude=amplitude
-            )
-        except Exception as e:
-            raise ValueError(f"Curve fitting failed: {e}")
+        # Prefer the closed-form estimate as starting point, so the iterative
+        # solver only has to refine it; fall back to the heuristic guess
+        initial_guesses = [heuristic_guess]
+        linearized = self._linearized_guess(
+            angles, measurements, baseline=baseline_guess, peak=amplitude_guess
+        )
+        if linearized is not None:
+            initial_guesses.insert(0, np.clip(linearized, bounds[0], bounds[1]))
+        
+        error = None
+        for initial_guess in initial_guesses:
+            try:
+                # Perform curve fitting
+                params, _ = curve_fit(
+                    self.gaussian_function,
+                    angles,
+                    measurements,
+                    p0=initial_guess,
+                    bounds=bounds,
+                    method='trf',
+                    jac=self._gaussian_jac,
+                    x_scale='jac',
+                    maxfev=10000
+                )
+                break
+            except Exception as e:
+                error = e
+        else:
+            raise ValueError(f"Curve fitting failed: {error}")
+        
+        mu, sigma, baseline, amplitude = params
+        
+        return GaussianParams(
+            mu=mu,
+            sigma=sigma,
+            baseline=baseline,
+            amplitude=amplitude
+        )
     
     def predict(self, angle: float, params: GaussianParams) -> float:
         """
@@ -118,13 +268,13 @@ class GaussianFitter:
         Returns:
             Predicted measurement value
         """
-        return self.gaussian_function(
-            np.array([angle]),
+        return self._scalar_gaussian(
+            angle,
             params.mu,
             params.sigma,
             params.baseline,
             params.amplitude
-        )[0]
+        )
     
     def find_peak(self, params: GaussianParams) -> float:
         """
@@ -155,7 +305,7 @@ class GaussianFitter:
         Returns:
             Tuple of (angles, predicted_values)
         """
-        angles = np.linspace(Config.MIN_ANGLE, Config.MAX_ANGLE, num_points)
+        angles = _plot_grid(num_points)
         values = self.gaussian_function(
             angles,
             params.mu,
@@ -2,12 +2,29 @@
 Module for creating a scatter-plot of the calibration data points
 and the fitted Gaussian curve.
 """
+import hashlib
 import os
+import threading
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+import numpy as np
 from config import Config
 from datetime import datetime
+from src.curve_fitting import GaussianFitter
+
+
+# Output formats supported by plot_results
+PLOT_FORMATS = ('png', 'svg', 'pdf')
+
+# Stateless fitter used to evaluate fitted curves
+_FITTER = GaussianFitter()
+
+# Figure and artists reused across plots, so repeated calls only update data
+_FIG = None
+_AX = None
+_ARTISTS = {}
+_FIGURE_LOCK = threading.Lock()
 
 
 class ResultsPlotter:
@@ -18,23 +35,149 @@ class ResultsPlotter:
         result,
         output_dir_name: str = Config.PLOT_OUTPUT_DIR,
         file_base_name: str = Config.PLOT_FILE_BASE_NAME,
-        show_plot: bool = False
-    ) -> None:
+        show_plot: bool = False,
+        file_format: str = Config.PLOT_FORMAT
+    ) -> str:
         """
         Generate and save a scatter plot of calibration results.
         
+        The key of the plotted result is stored in a `<file_base_name>.hash`
+        sidecar next to the plots. If the same result is plotted again and
+        its file still exists, that file is reused instead of redrawn.
+        
         Args:
             result: CalibrationResult object with measurement data
-            filename: Output filename for the plot
+            output_dir_name: Directory the plot is saved in
+            file_base_name: Plot file name prefix (a timestamp is appended)
             show_plot: If True, display the plot interactively
+            file_format: Output format and file extension ("png", "svg"
+                or "pdf"); vector formats skip rasterization
+        
+        Returns:
+            Path of the saved plot
+        """
+        file_format = file_format.lower()
+        if file_format not in PLOT_FORMATS:
+            raise ValueError(
+                f"Unsupported plot format {file_format!r}, expected one of {PLOT_FORMATS}"
+            )
+        
+        key = ResultsPlotter._result_key(result, file_format)
+        sidecar_path = os.path.join(output_dir_name, f"{file_base_name}.hash")
+        
+        if not show_plot:
+            previous_path = ResultsPlotter._read_sidecar(sidecar_path, key)
+            if previous_path is not None:
+                print(f"\nPlot unchanged, reusing: {previous_path}")
+                return previous_path
+        
+        with _FIGURE_LOCK:
+            file_path = ResultsPlotter._draw(
+                result, output_dir_name, file_base_name, show_plot, file_format
+            )
+        
+        with open(sidecar_path, 'w') as sidecar:
+            sidecar.write(f"{key}\n{file_path}\n")
+        return file_path
+    
+    @staticmethod
+    def _result_key(result, file_format: str) -> str:
         """
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=Config.FIGURE_SIZE)
+        Hash everything the plot is drawn from.
+        
+        Args:
+            result: CalibrationResult object with measurement data
+            file_format: Output format of the plot
         
-        # Plot measured data points as scatter
-        ax.scatter(
-            result.all_angles,
-            result.all_measurements,
+        Returns:
+            Hex digest identifying the plotted content
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(repr((
+            file_format,
+            result.fitted_params,
+            result.optimal_angle,
+            result.measured_voltage,
+            result.total_measurements
+        )).encode())
+        digest.update(np.ascontiguousarray(result.all_angles, dtype=float).tobytes())
+        digest.update(np.ascontiguousarray(result.all_measurements, dtype=float).tobytes())
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _read_sidecar(sidecar_path: str, key: str):
+        """
+        Look up the plot saved for a result key.
+        
+        Args:
+            sidecar_path: Path of the hash sidecar file
+            key: Key of the result about to be plotted
+        
+        Returns:
+            Path of the existing plot, or None if it must be drawn
+        """
+        try:
+            with open(sidecar_path) as sidecar:
+                stored_key, file_path = sidecar.read().splitlines()
+        except (OSError, ValueError):
+            return None
+        if stored_key != key or not os.path.exists(file_path):
+            return None
+        return file_path
+    
+    @staticmethod
+    def _draw(result, output_dir_name: str, file_base_name: str, show_plot: bool,
+              file_format: str) -> str:
+        """Draw and save the plot on the shared figure (caller holds the lock)."""
+        global _FIG, _AX
+        
+        # Create the figure and its artists on first use; later plots only
+        # update the data of the existing artists
+        first_plot = _FIG is None
+        if first_plot:
+            _FIG, _AX = plt.subplots(figsize=Config.FIGURE_SIZE)
+            ResultsPlotter._create_artists(_AX)
+        fig, ax = _FIG, _AX
+        
+        ResultsPlotter._update_artists(ax, result)
+        
+        # Tight layout (labels, title and ticks are fixed, so once is enough)
+        if first_plot:
+            fig.tight_layout()
+        
+        # Save the plot
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        
+        # Create output directory if it doesn't exist
+        os.makedirs(output_dir_name, exist_ok=True)
+        file_path = f"{output_dir_name}/{file_base_name}_{timestamp}.{file_format}"
+        # The layout is already tight, so skip the extra render pass of
+        # bbox_inches='tight'
+        if file_format == 'png':
+            # Lighter PNG compression speeds up encoding
+            fig.savefig(
+                file_path,
+                dpi=Config.PLOT_DPI,
+                pil_kwargs={'compress_level': Config.PLOT_PNG_COMPRESSION}
+            )
+        else:
+            # Vector output is written directly, without rasterizing
+            fig.savefig(file_path, format=file_format)
+        print(f"\nPlot saved to: {file_path}")
+        
+        # Show plot if requested; the figure stays open for the next call
+        if show_plot:
+            plt.show()
+        
+        return file_path
+    
+    @staticmethod
+    def _create_artists(ax) -> None:
+        """Create the axes decorations and the artists updated by each plot."""
+        # Measured data points as scatter
+        _ARTISTS['scatter'] = ax.scatter(
+            [],
+            [],
             alpha=0.6,
             s=50,
             color='blue',
@@ -42,40 +185,34 @@ class ResultsPlotter:
             zorder=3
         )
         
-        # Generate and plot fitted Gaussian curve
-        from src.curve_fitting import GaussianFitter
-        fitter = GaussianFitter()
-        curve_angles, curve_values = fitter.generate_curve(result.fitted_params)
-        
-        ax.plot(
-            curve_angles,
-            curve_values,
+        # Fitted Gaussian curve
+        _ARTISTS['curve'], = ax.plot(
+            [],
+            [],
             color='magenta',
             linewidth=2,
             label='Fitted Gaussian Curve',
             zorder=2
         )
         
-        # Mark the optimal angle
-        ax.axvline(
-            result.optimal_angle,
+        # Line marking the optimal angle
+        _ARTISTS['optimal_line'] = ax.axvline(
+            Config.MIN_ANGLE,
             color='green',
             linestyle='--',
             linewidth=2,
-            label=f'Optimal Angle: {result.optimal_angle:.1f}°',
             zorder=1
         )
         
-        # Add marker at optimal point
-        ax.plot(
-            result.optimal_angle,
-            result.measured_voltage,
+        # Marker at optimal point
+        _ARTISTS['optimal_marker'], = ax.plot(
+            [],
+            [],
             marker='*',
             markersize=20,
             color='gold',
             markeredgecolor='black',
             markeredgewidth=1.5,
-            label=f'Measured: {result.measured_voltage:.2f}V',
             zorder=4
         )
         
@@ -92,47 +229,54 @@ class ResultsPlotter:
         # Grid
         ax.grid(True, alpha=0.3, linestyle='--')
         
-        # Legend
-        ax.legend(loc='best', fontsize=10, framealpha=0.9)
-        
         # Set axis limits
         ax.set_xlim(Config.MIN_ANGLE, Config.MAX_ANGLE)
         ax.set_ylim(-5, 105)
         
-        # Add text box with key statistics
-        textstr = '\n'.join([
-            f'Total Measurements: {result.total_measurements}',
-            f'Peak Position (μ): {result.fitted_params.mu:.2f}°',
-            f'Peak Width (σ): {result.fitted_params.sigma:.2f}°',
-            f'Baseline: {result.fitted_params.baseline:.2f}',
-            f'Amplitude: {result.fitted_params.amplitude:.2f}'
-        ])
+        # Few fixed ticks: every tick is a separate artist to lay out and draw
+        ax.set_xticks(np.arange(Config.MIN_ANGLE, Config.MAX_ANGLE + 1, 45))
+        ax.set_yticks(np.arange(0, 101, 20))
+        ax.minorticks_off()
         
+        # Text box with key statistics
         props = dict(boxstyle='round', facecolor='wheat', alpha=0.3)
-        ax.text(
+        _ARTISTS['textbox'] = ax.text(
             0.02, 0.98,
-            textstr,
+            '',
             transform=ax.transAxes,
             fontsize=9,
             verticalalignment='top',
             bbox=props
         )
+    
+    @staticmethod
+    def _update_artists(ax, result) -> None:
+        """Show a calibration result on the artists made by `_create_artists`."""
+        _ARTISTS['scatter'].set_offsets(
+            np.column_stack((result.all_angles, result.all_measurements))
+        )
         
-        # Tight layout
-        plt.tight_layout()
+        curve_angles, curve_values = _FITTER.generate_curve(
+            result.fitted_params,
+            num_points=Config.PLOT_CURVE_POINTS
+        )
+        _ARTISTS['curve'].set_data(curve_angles, curve_values)
         
-        # Save the plot
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir_name, exist_ok=True)
-        file_path = f"{output_dir_name}/{file_base_name}_{timestamp}.png"
-        plt.savefig(file_path, dpi=Config.PLOT_DPI, bbox_inches='tight')
-        print(f"\nPlot saved to: {file_path}")
+        optimal_line = _ARTISTS['optimal_line']
+        optimal_line.set_xdata([result.optimal_angle, result.optimal_angle])
+        optimal_line.set_label(f'Optimal Angle: {result.optimal_angle:.1f}°')
         
-        # Show plot if requested
-        if show_plot:
-            plt.show()
-        else:
-            plt.close()
-    
\ No newline at end of file
+        optimal_marker = _ARTISTS['optimal_marker']
+        optimal_marker.set_data([result.optimal_angle], [result.measured_voltage])
+        optimal_marker.set_label(f'Measured: {result.measured_voltage:.2f}V')
+        
+        # Legend (rebuilt, since its labels include the result values)
+        ax.legend(loc='best', fontsize=10, framealpha=0.9)
+        
+        _ARTISTS['textbox'].set_text('\n'.join([
+            f'Total Measurements: {result.total_measurements}',
+            f'Peak Position (μ): {result.fitted_params.mu:.2f}°',
+            f'Peak Width (σ): {result.fitted_params.sigma:.2f}°',
+            f'Baseline: {result.fitted_params.baseline:.2f}',
+            f'Amplitude: {result.fitted_params.amplitude:.2f}'
+        ]))
@@ -6,17 +6,65 @@ the peak in the measurement response.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import functools
+import logging
+import math
 import numpy as np
-from typing import List, Tuple
+from typing import Callable, Dict, Optional, Sequence, Tuple
 from config import Config
 
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _step_grid(step: float) -> np.ndarray:
+    """
+    Build the grid of all valid angles for a step size.
+    
+    Each step size is built once and shared; the returned array is
+    read-only to protect the cached copy.
+    
+    Args:
+        step: Step size between angles
+    
+    Returns:
+        Read-only sorted array of MIN_ANGLE + k * step within the valid range
+    """
+    count = int(math.floor((Config.MAX_ANGLE - Config.MIN_ANGLE) / step + 1e-9)) + 1
+    grid = Config.MIN_ANGLE + step * np.arange(count)
+    grid.setflags(write=False)
+    return grid
+
+
+def _angle_grid(start: float, end: float, step: float) -> np.ndarray:
+    """
+    Select the grid angles from start to end (inclusive).
+    
+    The angles are a slice of the shared grid for `step`, so no new array
+    is allocated; bounds within step * 1e-3 of a grid angle include it.
+    
+    Args:
+        start: Start angle
+        end: End angle
+        step: Step size between angles
+    
+    Returns:
+        Read-only view of the grid angles within [start, end]
+    """
+    grid = _step_grid(float(step))
+    tolerance = step * 1e-3
+    first, last = np.searchsorted(grid, (start - tolerance, end + tolerance))
+    return grid[first:last]
+
+
 @dataclass
 class SearchResult:
     """Results from a search strategy."""
-    angles: List[float]  # All angles measured
-    measurements: List[float]  # Corresponding measurements
+    angles: np.ndarray  # All angles measured
+    measurements: np.ndarray  # Corresponding measurements
     estimated_peak_angle: float  # Best estimate of peak location
     total_measurements: int  # Total number of measurements taken
 
@@ -38,26 +86,179 @@ class SearchStrategy(ABC):
         pass
 
 
-class WideToNarrowSearch(SearchStrategy):
+class GoldenSectionRefiner:
     """
-    Wide-to-narrow search strategy.
+    Golden-section search for the maximum of a unimodal response.
     
-    This strategy works in multiple phases:
-    1. Wide scan: Wide spacing across full range to locate general peak area
-    2. Medium scan: Medium spacing around wide peak
-    3. Narrow scan: Fine spacing around medium peak  
-    4. Refinement: Very fine spacing around fine peak
+    Each iteration shrinks the bracket around the peak by the golden ratio
+    while reusing one of the two interior measurements, so a bracket of
+    width W is narrowed to the tolerance in about log(W / tol) / log(1.618)
+    measurements, instead of W / tol for a grid scan.
+    """
     
-    This approach minimizes the total number of measurements while reliably
-    finding the peak.
+    INV_PHI = (math.sqrt(5) - 1) / 2
+    
+    def __init__(self, window: float = Config.REFINEMENT_WINDOW, 
+                 tolerance: float = Config.ANGLE_PRECISION):
+        """
+        Initialize the refiner.
+        
+        Args:
+            window: Total width of the bracket around the starting peak
+            tolerance: Bracket width at which the search stops
+        """
+        self.window = window
+        self.tolerance = tolerance
+    
+    def refine(self, measure: Callable[[float], float], center: float,
+               noise: Optional[float] = None) -> float:
+        """
+        Locate the peak near a previous estimate.
+        
+        Args:
+            measure: Function returning the response at an angle
+            center: Previous peak estimate, used as center of the bracket
+            noise: Readings differing by no more than this cannot tell which
+                side the peak is on and end the search early (None = always
+                narrow the bracket to the tolerance)
+        
+        Returns:
+            Center of the final bracket
+        """
+        lower = max(Config.MIN_ANGLE, center - self.window / 2)
+        upper = min(Config.MAX_ANGLE, center + self.window / 2)
+        
+        inner_low = upper - self.INV_PHI * (upper - lower)
+        inner_high = lower + self.INV_PHI * (upper - lower)
+        value_low = measure(inner_low)
+        value_high = measure(inner_high)
+        
+        while upper - lower > self.tolerance:
+            if noise is not None and abs(value_low - value_high) <= noise:
+                break
+            if value_low > value_high:
+                # Peak lies in [lower, inner_high]
+                upper, inner_high, value_high = inner_high, inner_low, value_low
+                inner_low = upper - self.INV_PHI * (upper - lower)
+                value_low = measure(inner_low)
+            else:
+                # Peak lies in [inner_low, upper]
+                lower, inner_low, value_low = inner_low, inner_high, value_high
+                inner_high = lower + self.INV_PHI * (upper - lower)
+                value_high = measure(inner_high)
+        
+        return (lower + upper) / 2
+    
+    def max_evaluations(self) -> int:
+        """
+        Upper bound on the number of measurements taken by `refine`.
+        
+        Returns:
+            Two initial measurements plus one per bracket reduction
+        """
+        if self.window <= self.tolerance:
+            return 2
+        return 2 + math.ceil(math.log(self.tolerance / self.window) / math.log(self.INV_PHI))
+
+
+@dataclass(frozen=True)
+class ScanPhase:
+    """One grid scan phase of a multi-phase search."""
+    name: str  # Label used in progress output
+    step: float  # Step size between measurements
+    window: Optional[float] = None  # Width around previous peak (None = full range)
+
+
+class MultiPhaseSearch(SearchStrategy):
     """
+    Multi-phase search strategy.
     
-    def __init__(self):
-        """Initialize the wide-to-narrow search strategy."""
-        self.angles: List[float] = []
-        self.measurements: List[float] = []
+    Runs a sequence of grid scans, each centered on the peak found by the
+    previous one, optionally followed by a golden-section refinement:
+    1. The first phase scans the full angle range to locate the peak area
+    2. Each further phase scans a window around the previous peak
+    3. The refiner (if any) narrows the final peak to ANGLE_PRECISION
+    """
+    
+    def __init__(self, phases: Sequence[ScanPhase], 
+                 refiner: Optional[GoldenSectionRefiner] = None):
+        """
+        Initialize the multi-phase search strategy.
+        
+        Args:
+            phases: Scan phases in order; the first one should cover the
+                full range (window None)
+            refiner: Optional final refinement stage
+        """
+        self.phases = list(phases)
+        self.refiner = refiner
+        
+        # Search history stored as two float64 buffers sized for the whole
+        # search, so recording never has to grow them
+        capacity = self._max_measurements()
+        self._angles = np.empty(capacity)
+        self._measurements = np.empty(capacity)
+        self._count = 0
+        
+        # Values of angles measured so far, keyed by angle in units of
+        # ANGLE_PRECISION, so points shared by several phases are measured once
+        self._cache: Dict[int, float] = {}
+    
+    @staticmethod
+    def _phase_size(phase: ScanPhase) -> int:
+        """Upper bound on the number of measurements taken by a phase."""
+        if phase.window is None:
+            return _step_grid(float(phase.step)).size
+        return int(phase.window / phase.step) + 1
+    
+    def _max_measurements(self) -> int:
+        """
+        Upper bound on the number of measurements taken by one search.
+        
+        Returns:
+            Sum of the grid sizes of all phases plus the refiner budget
+        """
+        total = sum(self._phase_size(phase) for phase in self.phases)
+        if self.refiner is not None:
+            total += self.refiner.max_evaluations()
+        return max(total, 1)
+    
+    def _reset(self) -> None:
+        """Forget the history and memo of a previous search."""
+        self._count = 0
+        self._cache.clear()
+    
+    @property
+    def angles(self) -> np.ndarray:
+        """All angles measured so far (view into the history buffer)."""
+        return self._angles[:self._count]
+    
+    @property
+    def measurements(self) -> np.ndarray:
+        """Measurements corresponding to `angles` (view into the history buffer)."""
+        return self._measurements[:self._count]
+    
+    def _record(self, angles: np.ndarray, measurements: np.ndarray) -> None:
+        """
+        Append a block of measurements to the search history.
+        
+        Args:
+            angles: Measured angles
+            measurements: Measured values
+        """
+        end = self._count + angles.size
+        if end > self._angles.size:
+            # Only reached when repeated angles are re-measured
+            # (SEARCH_CACHE_ENABLED off); grow geometrically so appends
+            # stay amortized O(1)
+            capacity = max(end, 2 * self._angles.size)
+            self._angles = np.resize(self._angles, capacity)
+            self._measurements = np.resize(self._measurements, capacity)
+        self._angles[self._count:end] = angles
+        self._measurements[self._count:end] = measurements
+        self._count = end
     
-    def _measure_range(self, client, start: float, end: float, step: float) -> List[Tuple[float, float]]:
+    def _measure_range(self, client, start: float, end: float, step: float) -> Tuple[np.ndarray, np.ndarray]:
         """
         Measure a range of angles with a given step size.
         
@@ -68,93 +269,377 @@ class WideToNarrowSearch(SearchStrategy):
             step: Step size between measurements
             
         Returns:
-            List of (angle, measurement) tuples
+            Tuple of (angles, measurements) arrays
         """
-        angles = np.arange(start, end + step, step)
-        # Ensure angles are within valid range
-        angles = angles[(angles >= Config.MIN_ANGLE) & (angles <= Config.MAX_ANGLE)]
-        results = []
+        angles = _angle_grid(start, end, step)
+        return self._measure_angles(client, angles)
+    
+    def _measure_angles(self, client, angles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Measure the given angles and record them in the search history.
+        
+        New angles are measured together through `_measure_new`. Results
+        are recorded in the order of `angles` once all have returned.
         
-        for angle in angles:
+        Angles already measured by this search (to within ANGLE_PRECISION)
+        reuse the earlier value and are not recorded again. With
+        Config.SEARCH_CACHE_ENABLED off, every angle is a fresh reading from
+        the server (bypassing the client cache too) and is recorded.
+        
+        Args:
+            client: MeasurementClient instance
+            angles: Angles to measure
+        
+        Returns:
+            Tuple of (angles, measurements) arrays for the successful
+            measurements, including reused ones
+        """
+        angles = np.asarray(angles, dtype=float)
+        cache = self._cache if Config.SEARCH_CACHE_ENABLED else {}
+        keys = np.rint(angles / Config.ANGLE_PRECISION).astype(np.int64).tolist()
+        
+        pending: Dict[int, float] = {}
+        for key, angle in zip(keys, angles.tolist()):
+            if key not in cache:
+                pending.setdefault(key, angle)
+        new_measurements = self._measure_new(client, pending) if pending else {}
+        
+        # New measurements come back in the order of `pending`, i.e. of
+        # their first occurrence in `angles`; record them as one block
+        count = len(new_measurements)
+        self._record(
+            np.fromiter((pending[key] for key in new_measurements), dtype=float, count=count),
+            np.fromiter(new_measurements.values(), dtype=float, count=count)
+        )
+        cache.update(new_measurements)
+        
+        # Angles that failed to measure have no value and are left out
+        measurements = np.fromiter(
+            (cache.get(key, np.nan) for key in keys), dtype=float, count=len(keys)
+        )
+        measured = ~np.isnan(measurements)
+        return angles[measured], measurements[measured]
+    
+    def _measure_new(self, client, pending: Dict[int, float]) -> Dict[int, float]:
+        """
+        Measure angles not taken before by this search.
+        
+        All angles go to the server in one `client.measure_many` call. If
+        that fails, each angle is measured on its own, concurrently (up to
+        Config.MAX_PARALLEL), so one bad angle does not lose the others.
+        
+        Args:
+            client: MeasurementClient instance
+            pending: Angles to measure, keyed by their cache key
+        
+        Returns:
+            Measurements of the successful angles, keyed by cache key
+        """
+        angles = np.fromiter(pending.values(), dtype=float, count=len(pending))
+        try:
+            measurements = client.measure_many(angles, use_cache=Config.SEARCH_CACHE_ENABLED)
+            return dict(zip(pending.keys(), measurements.tolist()))
+        except Exception as e:
+            logger.warning("Batch measurement failed (%s), measuring angles individually", e)
+        
+        with ThreadPoolExecutor(max_workers=Config.MAX_PARALLEL) as executor:
+            futures = {
+                key: executor.submit(client.measure, angle, use_cache=Config.SEARCH_CACHE_ENABLED)
+                for key, angle in pending.items()
+            }
+        
+        measurements = {}
+        for key, future in futures.items():
             try:
-                measurement = client.measure(angle)
-                results.append((angle, measurement))
-                self.angles.append(angle)
-                self.measurements.append(measurement)
+                measurements[key] = future.result()
             except Exception as e:
-                print(f"Warning: Failed to measure at {angle}: {e}")
-        
-        return results
+                logger.warning("Failed to measure at %s: %s", pending[key], e)
+        return measurements
     
-    def _find_peak_in_results(self, results: List[Tuple[float, float]]) -> float:
+    def _find_peak_in_results(self, angles: np.ndarray, measurements: np.ndarray) -> float:
         """
         Find the angle with the maximum measurement in results.
         
         Args:
-            results: List of (angle, measurement) tuples
+            angles: Array of measured angles
+            measurements: Array of corresponding measurements
             
         Returns:
             Angle with maximum measurement
         """
-        if not results:
+        if measurements.size == 0:
             return Config.MAX_ANGLE / 2  # Default to middle if no results
         
-        max_angle, max_measurement = max(results, key=lambda x: x[1])
-        return max_angle
+        return float(angles[np.argmax(measurements)])
     
-    def search(self, client) -> SearchResult:
+    def _run_phase(self, client, phase: ScanPhase, 
+                   peak: float) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Execute the wide-to-narrow search.
+        Run one scan phase.
         
         Args:
             client: MeasurementClient instance
+            phase: Phase to run
+            peak: Peak estimate from the previous phase
             
+        Returns:
+            Tuple of (angles, measurements) arrays measured by the phase
+        """
+        if phase.window is None:
+            return self._measure_range(client, Config.MIN_ANGLE, Config.MAX_ANGLE, phase.step)
+        
+        # The whole window goes to the server as one batch
+        start = max(Config.MIN_ANGLE, peak - phase.window / 2)
+        end = min(Config.MAX_ANGLE, peak + phase.window / 2)
+        return self._measure_range(client, start, end, phase.step)
+    
+    def _refine(self, client, peak: float, noise: Optional[float] = None) -> float:
+        """
+        Refine a peak estimate with the golden-section refiner.
+        
+        Args:
+            client: MeasurementClient instance
+            peak: Peak estimate from the last scan phase
+            noise: Noise level of a reading, passed on to the refiner
+        
+        Returns:
+            Refined peak estimate
+        """
+        def measure(angle: float) -> float:
+            _, measurements = self._measure_angles(client, [angle])
+            # A failed measurement must not attract the search
+            return measurements[0] if measurements.size else -math.inf
+        
+        return self.refiner.refine(measure, peak, noise)
+    
+    def search(self, client) -> SearchResult:
+        """
+        Execute the multi-phase search.
+        
+        Args:
+            client: MeasurementClient instance
+        
         Returns:
             SearchResult with all measurements and estimated peak
         """
-        print("Starting wide-to-narrow search...")
+        logger.debug("Starting %d-phase search...", len(self.phases))
+        self._reset()
         
-        # Phase 1: Wide scan across full range
-        print(f"Phase 1: wide scan (step size: {Config.WIDE_SCAN_STEP}°)")
-        wide_results = self._measure_range(
-            client,
-            Config.MIN_ANGLE,
-            Config.MAX_ANGLE,
-            Config.WIDE_SCAN_STEP
-        )
-        wide_peak = self._find_peak_in_results(wide_results)
-        print(f"  Wide peak found near: {wide_peak:.1f}°")
-        
-        # Phase 2: Narrow scan around wide peak
-        print(f"Phase 2: Narrow scan (step size: {Config.NARROW_SCAN_STEP}°)")
-        narrow_start = max(Config.MIN_ANGLE, wide_peak - Config.FINE_WINDOW / 2)
-        narrow_end = min(Config.MAX_ANGLE, wide_peak + Config.FINE_WINDOW / 2)
-        narrow_results = self._measure_range(
-            client,
-            narrow_start,
-            narrow_end,
-            Config.NARROW_SCAN_STEP
-        )
-        fine_peak = self._find_peak_in_results(narrow_results)
-        print(f"  Narrow peak found near: {fine_peak:.1f}°")
-        
-        # Phase 3: Refinement scan for final precision
-        print(f"Phase 3: Refinement scan (step size: {Config.REFINEMENT_STEP}°)")
-        refine_start = max(Config.MIN_ANGLE, fine_peak - Config.REFINEMENT_WINDOW / 2)
-        refine_end = min(Config.MAX_ANGLE, fine_peak + Config.REFINEMENT_WINDOW / 2)
-        refine_results = self._measure_range(
-            client,
-            refine_start,
-            refine_end,
-            Config.REFINEMENT_STEP
-        )
-        final_peak = self._find_peak_in_results(refine_results)
-        print(f"  Final peak estimate: {final_peak:.1f}°")
+        peak = self._scan_phases(client, self.phases, Config.MAX_ANGLE / 2)
         
+        if self.refiner is not None:
+            logger.debug("Phase %d: Refinement search (tolerance: %s°)", 
+                         len(self.phases) + 1, self.refiner.tolerance)
+            peak = self._refine(client, peak)
+            logger.debug("  Final peak estimate: %.1f°", peak)
+        
+        return self._result(peak)
+    
+    def _scan_phases(self, client, phases: Sequence[ScanPhase], peak: float, 
+                     first_number: int = 1) -> float:
+        """
+        Run scan phases in order, carrying the peak estimate forward.
+        
+        Args:
+            client: MeasurementClient instance
+            phases: Phases to run
+            peak: Peak estimate before the first phase
+            first_number: Phase number printed for the first phase
+        
+        Returns:
+            Peak estimate after the last phase
+        """
+        for number, phase in enumerate(phases, start=first_number):
+            logger.debug("Phase %d: %s scan (step size: %s°)", number, phase.name, phase.step)
+            peak = self._find_peak_in_results(*self._run_phase(client, phase, peak))
+            logger.debug("  %s peak found near: %.1f°", phase.name.capitalize(), peak)
+        return peak
+    
+    def _result(self, peak: float) -> SearchResult:
+        """
+        Package the search history and final peak estimate.
+        
+        Args:
+            peak: Final peak estimate
+        
+        Returns:
+            SearchResult with all measurements and estimated peak; its
+            arrays are copies, independent of the history buffers
+        """
         return SearchResult(
-            angles=self.angles,
-            measurements=self.measurements,
-            estimated_peak_angle=final_peak,
-            total_measurements=len(self.angles)
+            angles=self.angles.copy(),
+            measurements=self.measurements.copy(),
+            estimated_peak_angle=peak,
+            total_measurements=self._count
         )
 
+
+class WideToNarrowSearch(MultiPhaseSearch):
+    """
+    Wide-to-narrow search strategy.
+    
+    1. Wide scan: Wide spacing across full range to locate general peak area
+    2. Narrow scan: Fine spacing around wide peak
+    3. Refinement: Golden-section search around narrow peak
+    
+    This approach minimizes the total number of measurements while reliably
+    finding the peak.
+    """
+    
+    PHASES = (
+        ScanPhase("wide", Config.WIDE_SCAN_STEP),
+        ScanPhase("narrow", Config.NARROW_SCAN_STEP, Config.FINE_WINDOW),
+    )
+    
+    def __init__(self, refiner: Optional[GoldenSectionRefiner] = None):
+        """
+        Initialize the wide-to-narrow search strategy.
+        
+        Args:
+            refiner: Final refinement stage (defaults to GoldenSectionRefiner)
+        """
+        super().__init__(self.PHASES, refiner or GoldenSectionRefiner())
+
+
+class CoarseToFineSearch(MultiPhaseSearch):
+    """
+    Coarse-to-fine grid search strategy.
+    
+    1. Coarse scan: Wide spacing across full range
+    2. Medium scan: Medium spacing around coarse peak
+    3. Fine scan: Fine spacing around medium peak
+    4. Refinement scan: Very fine spacing around fine peak
+    
+    Uses grid scans only, which is more robust than golden-section
+    refinement on very noisy signals at the cost of more measurements.
+    """
+    
+    PHASES = (
+        ScanPhase("coarse", Config.WIDE_SCAN_STEP),
+        ScanPhase("medium", Config.MEDIUM_SCAN_STEP, Config.MEDIUM_WINDOW),
+        ScanPhase("fine", Config.NARROW_SCAN_STEP, Config.FINE_WINDOW),
+        ScanPhase("refinement", Config.REFINEMENT_STEP, Config.REFINEMENT_WINDOW),
+    )
+    
+    def __init__(self):
+        """Initialize the coarse-to-fine search strategy."""
+        super().__init__(self.PHASES)
+
+
+class AdaptiveSearch(MultiPhaseSearch):
+    """
+    Adaptive search strategy.
+    
+    1. Wide scan: Wide spacing across full range to bracket the peak
+    2. Refinement: Golden-section search over one wide step on either side
+       of the wide peak, stopped once its two readings are within the noise
+       level of the wide scan
+    3. Fit scan: Narrow grid window around the refined peak
+    
+    The golden-section points cluster on the flat top of the peak, where
+    noise rather than the response decides each step, so the refined peak
+    only centers the fit scan; the flanks measured there are what the curve
+    fit needs.
+    
+    The golden-section search assumes a clean unimodal response. If the
+    wide scan is too noisy for that (peak prominence below
+    Config.ADAPTIVE_MIN_SNR times the noise level), the search continues
+    with the grid phases of CoarseToFineSearch instead.
+    """
+    
+    PHASES = (ScanPhase("wide", Config.WIDE_SCAN_STEP),)
+    FIT_PHASE = ScanPhase("fit", Config.NARROW_SCAN_STEP, Config.FINE_WINDOW)
+    FALLBACK_PHASES = CoarseToFineSearch.PHASES[1:]
+    
+    def __init__(self, refiner: Optional[GoldenSectionRefiner] = None):
+        """
+        Initialize the adaptive search strategy.
+        
+        Args:
+            refiner: Refinement stage (defaults to a GoldenSectionRefiner
+                spanning one wide step on either side of the wide peak)
+        """
+        super().__init__(
+            self.PHASES,
+            refiner or GoldenSectionRefiner(window=2 * Config.WIDE_SCAN_STEP)
+        )
+    
+    def _max_measurements(self) -> int:
+        """
+        Upper bound on the number of measurements taken by one search.
+        
+        Returns:
+            Budget of the regular search plus the fit scan and the
+            fallback grid phases
+        """
+        fallback = sum(self._phase_size(phase) for phase in self.FALLBACK_PHASES)
+        return super()._max_measurements() + self._phase_size(self.FIT_PHASE) + fallback
+    
+    @staticmethod
+    def _noise_level(measurements: np.ndarray) -> float:
+        """
+        Estimate the noise level of a grid scan.
+        
+        A smooth response has second differences near zero away from the
+        peak, so their median absolute value is a robust noise scale.
+        
+        Args:
+            measurements: Measurements of a grid scan, in angle order
+        
+        Returns:
+            Noise scale (0.0 for fewer than three measurements)
+        """
+        if measurements.size < 3:
+            return 0.0
+        return float(np.median(np.abs(np.diff(measurements, 2))))
+    
+    @classmethod
+    def _signal_to_noise(cls, measurements: np.ndarray) -> float:
+        """
+        Estimate how clearly the peak stands out of a grid scan.
+        
+        Args:
+            measurements: Measurements of a grid scan, in angle order
+        
+        Returns:
+            Peak prominence over the median in units of the noise scale
+        """
+        if measurements.size < 3:
+            return 0.0
+        noise = cls._noise_level(measurements)
+        prominence = measurements.max() - np.median(measurements)
+        if noise == 0:
+            return math.inf if prominence > 0 else 0.0
+        return float(prominence / noise)
+    
+    def search(self, client) -> SearchResult:
+        """
+        Execute the adaptive search.
+        
+        Args:
+            client: MeasurementClient instance
+        
+        Returns:
+            SearchResult with all measurements and estimated peak
+        """
+        logger.debug("Starting adaptive search...")
+        self._reset()
+        
+        peak = self._scan_phases(client, self.phases, Config.MAX_ANGLE / 2)
+        
+        snr = self._signal_to_noise(self.measurements)
+        if snr >= Config.ADAPTIVE_MIN_SNR:
+            noise = self._noise_level(self.measurements)
+            logger.debug("Phase %d: Refinement search (tolerance: %s°, noise: %.2f)", 
+                         len(self.phases) + 1, self.refiner.tolerance, noise)
+            peak = self._refine(client, peak, noise)
+            logger.debug("  Final peak estimate: %.1f°", peak)
+            self._scan_phases(client, (self.FIT_PHASE,), peak, 
+                              first_number=len(self.phases) + 2)
+        else:
+            logger.debug("  Signal-to-noise ratio %.1f too low for refinement, "
+                         "falling back to grid scans", snr)
+            peak = self._scan_phases(client, self.FALLBACK_PHASES, peak, 
+                                        first_number=len(self.phases) + 1)
+        
+        return self._result(peak)
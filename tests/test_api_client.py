@@ -4,6 +4,7 @@ Unit tests for the MeasurementClient.
 
 import unittest
 from unittest.mock import Mock, patch
+import numpy as np
 import requests
 from src.api_client import MeasurementClient
 from config import Config
@@ -22,7 +23,7 @@ class TestMeasurementClient(unittest.TestCase):
         self.assertEqual(self.client.timeout, Config.SERVER_TIMEOUT)
         self.assertEqual(self.client.total_measurements, 0)
     
-    @patch('src.api_client.requests.get')
+    @patch('src.api_client.requests.Session.get')
     def test_check_status_success(self, mock_get):
         """Test successful status check."""
         mock_response = Mock()
@@ -35,7 +36,26 @@ class TestMeasurementClient(unittest.TestCase):
         self.assertTrue(result)
         mock_get.assert_called_once()
     
-    @patch('src.api_client.requests.get')
+    @patch('src.api_client.time.monotonic')
+    @patch('src.api_client.requests.Session.get')
+    def test_check_status_cached(self, mock_get, mock_monotonic):
+        """Test that a recent successful status check is reused."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"status": "up"}
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        
+        mock_monotonic.return_value = 1000.0
+        self.assertTrue(self.client.check_server_status())
+        mock_monotonic.return_value = 1000.0 + Config.STATUS_CACHE_TTL / 2
+        self.assertTrue(self.client.check_server_status())
+        self.assertEqual(mock_get.call_count, 1)
+        
+        mock_monotonic.return_value = 1000.0 + Config.STATUS_CACHE_TTL + 1
+        self.assertTrue(self.client.check_server_status())
+        self.assertEqual(mock_get.call_count, 2)
+    
+    @patch('src.api_client.requests.Session.get')
     def test_check_status_failure(self, mock_get):
         """Test status check when server is down."""
         mock_get.side_effect = requests.RequestException("Connection failed")
@@ -44,7 +64,7 @@ class TestMeasurementClient(unittest.TestCase):
         
         self.assertFalse(result)
     
-    @patch('src.api_client.requests.get')
+    @patch('src.api_client.requests.Session.get')
     def test_measure_success(self, mock_get):
         """Test successful measurement."""
         mock_response = Mock()
@@ -67,6 +87,264 @@ class TestMeasurementClient(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.client.measure(400.0)
     
+    @patch('src.api_client.requests.Session.get')
+    def test_measure_with_averaging_single_sample(self, mock_get):
+        """Test that one sample takes the plain measure path."""
+        mock_response = Mock()
+        mock_response.json.return_value = 70.0
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        
+        measurement = self.client.measure_with_averaging(45.0, num_samples=1)
+        
+        self.assertEqual(measurement, 70.0)
+        self.assertEqual(mock_get.call_args.kwargs["params"], {"angle": 45.0})
+        self.assertEqual(self.client.total_measurements, 1)
+    
+    @patch('src.api_client.requests.Session.post')
+    def test_measure_with_averaging_batch(self, mock_post):
+        """Test that several samples are fresh readings from one batch request."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [70, 72, 71, 72]
+        mock_response.raise_for_status = Mock()
+        mock_post.return_value = mock_response
+        
+        measurement = self.client.measure_with_averaging(45.0, num_samples=4)
+        
+        self.assertEqual(measurement, 71.25)
+        mock_post.assert_called_once()
+        self.assertEqual(mock_post.call_args.kwargs["json"], {"angles": [45.0] * 4})
+        self.assertEqual(self.client.total_measurements, 4)
+        self.assertEqual(self.client._cache, {})
+    
+    @patch('src.api_client.requests.Session.get')
+    @patch('src.api_client.requests.Session.post')
+    def test_measure_with_averaging_fallback(self, mock_post, mock_get):
+        """Test averaging against a server without the batch endpoint."""
+        mock_post.return_value = Mock(status_code=404)
+        readings = iter([60.0, 70.0, 80.0])
+        
+        def fake_get(url, params, timeout):
+            response = Mock()
+            response.json.return_value = next(readings)
+            response.raise_for_status = Mock()
+            return response
+        mock_get.side_effect = fake_get
+        
+        measurement = self.client.measure_with_averaging(45.0, num_samples=3)
+        
+        self.assertAlmostEqual(measurement, 70.0)
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(self.client.total_measurements, 3)
+    
+    def test_measure_with_averaging_invalid_samples(self):
+        """Test averaging with a non-positive number of samples."""
+        with self.assertRaises(ValueError):
+            self.client.measure_with_averaging(45.0, num_samples=0)
+    
+    @patch('src.api_client.requests.Session.post')
+    def test_measure_batch_single_request(self, mock_post):
+        """Test that a batch of angles is measured with one request."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [10, 55, 97]
+        mock_response.raise_for_status = Mock()
+        mock_post.return_value = mock_response
+        
+        results = self.client.measure_batch([30.0, 45.0, 50.0])
+        
+        self.assertEqual(results, [(30.0, 10.0), (45.0, 55.0), (50.0, 97.0)])
+        self.assertEqual(self.client.total_measurements, 3)
+        mock_post.assert_called_once()
+    
+    @patch('src.api_client.requests.Session.post')
+    def test_measure_many_returns_array(self, mock_post):
+        """Test that measure_many returns measurements as a NumPy array."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [10, 55]
+        mock_response.raise_for_status = Mock()
+        mock_post.return_value = mock_response
+        
+        results = self.client.measure_many(np.array([30.0, 45.0]))
+        
+        self.assertIsInstance(results, np.ndarray)
+        np.testing.assert_array_equal(results, [10.0, 55.0])
+        self.assertEqual(self.client.total_measurements, 2)
+    
+    @patch('src.api_client.requests.Session.post')
+    def test_measure_many_bypass_cache(self, mock_post):
+        """Test that use_cache=False measures every angle and leaves the cache alone."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [12, 14]
+        mock_response.raise_for_status = Mock()
+        mock_post.return_value = mock_response
+        self.client._cache[self.client._cache_key(10.0)] = 15.0
+        
+        results = self.client.measure_many(np.array([10.0, 10.0]), use_cache=False)
+        
+        np.testing.assert_array_equal(results, [12.0, 14.0])
+        self.assertEqual(mock_post.call_args.kwargs["json"], {"angles": [10.0, 10.0]})
+        self.assertEqual(self.client._cache, {self.client._cache_key(10.0): 15.0})
+    
+    @patch('src.api_client.requests.Session.get')
+    @patch('src.api_client.requests.Session.post')
+    def test_measure_batch_fallback(self, mock_post, mock_get):
+        """Test batch measurement against a server without the batch endpoint."""
+        mock_post.return_value = Mock(status_code=404)
+        mock_response = Mock()
+        mock_response.json.return_value = 42.0
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        
+        results = self.client.measure_batch([10.0, 20.0])
+        
+        self.assertEqual(results, [(10.0, 42.0), (20.0, 42.0)])
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(self.client.total_measurements, 2)
+    
+    @patch('src.api_client.requests.Session.get')
+    @patch('src.api_client.requests.Session.post')
+    def test_measure_batch_fallback_remembered(self, mock_post, mock_get):
+        """Test that a missing batch endpoint is only tried once."""
+        mock_post.return_value = Mock(status_code=404)
+        mock_response = Mock()
+        mock_response.json.return_value = 42.0
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        
+        self.client.measure_batch([10.0, 20.0])
+        results = self.client.measure_batch([30.0, 40.0])
+        
+        self.assertEqual(results, [(30.0, 42.0), (40.0, 42.0)])
+        mock_post.assert_called_once()
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(self.client.total_measurements, 4)
+    
+    def test_measure_batch_invalid_angle(self):
+        """Test batch measurement with an angle outside the valid range."""
+        with self.assertRaises(ValueError):
+            self.client.measure_batch([10.0, 400.0])
+    
+    @patch('src.api_client.requests.Session.get')
+    def test_measure_parallel(self, mock_get):
+        """Test concurrent measurement of independent angles."""
+        def fake_get(url, params, timeout):
+            response = Mock()
+            response.json.return_value = params["angle"] / 2
+            response.raise_for_status = Mock()
+            return response
+        mock_get.side_effect = fake_get
+        angles = [float(angle) for angle in range(0, 100, 5)]
+        
+        results = self.client.measure_parallel(angles, max_workers=4)
+        
+        self.assertEqual(results, [(angle, angle / 2) for angle in angles])
+        self.assertEqual(mock_get.call_count, len(angles))
+        self.assertEqual(self.client.total_measurements, len(angles))
+    
+    @patch('src.api_client.requests.Session.get')
+    def test_session_reused_across_measurements(self, mock_get):
+        """Test that repeated measurements go through the persistent session."""
+        mock_response = Mock()
+        mock_response.json.return_value = 50.0
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        
+        self.client.measure(10.0)
+        self.client.measure(20.0)
+        
+        self.assertEqual(mock_get.call_count, 2)
+        for call in mock_get.call_args_list:
+            self.assertEqual(call.args[0], f"{Config.SERVER_URL}/measure/")
+    
+    @patch('src.api_client.requests.Session.get')
+    def test_measure_uses_cache(self, mock_get):
+        """Test that repeated angles are served from the cache."""
+        mock_response = Mock()
+        mock_response.json.return_value = 60.0
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        
+        first = self.client.measure(30.0)
+        second = self.client.measure(30.04)  # Same angle to within ANGLE_PRECISION
+        
+        self.assertEqual(first, second)
+        mock_get.assert_called_once()
+        self.assertEqual(self.client.total_measurements, 1)
+    
+    @patch('src.api_client.requests.Session.get')
+    def test_measure_bypass_cache(self, mock_get):
+        """Test that use_cache=False and clear_cache force a new request."""
+        mock_response = Mock()
+        mock_response.json.return_value = 60.0
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        
+        self.client.measure(30.0)
+        self.client.measure(30.0, use_cache=False)
+        self.client.clear_cache()
+        self.client.measure(30.0)
+        
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(self.client.total_measurements, 3)
+    
+    @patch('src.api_client.requests.Session.get')
+    def test_measure_bypass_cache_keeps_cached_value(self, mock_get):
+        """Test that a fresh reading does not replace the cached sample."""
+        first, second = Mock(), Mock()
+        first.json.return_value = 60.0
+        second.json.return_value = 65.0
+        mock_get.side_effect = [first, second]
+        
+        self.client.measure(30.0)
+        fresh = self.client.measure(30.0, use_cache=False)
+        cached = self.client.measure(30.0)
+        
+        self.assertEqual(fresh, 65.0)
+        self.assertEqual(cached, 60.0)
+        self.assertEqual(mock_get.call_count, 2)
+    
+    @patch('src.api_client.requests.Session.post')
+    def test_measure_batch_only_sends_uncached(self, mock_post):
+        """Test that a batch only requests angles missing from the cache."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [20, 30]
+        mock_response.raise_for_status = Mock()
+        mock_post.return_value = mock_response
+        self.client._cache[self.client._cache_key(10.0)] = 15.0
+        
+        results = self.client.measure_batch([10.0, 20.0, 30.0, 20.0])
+        
+        self.assertEqual(results, [(10.0, 15.0), (20.0, 20.0), (30.0, 30.0), (20.0, 20.0)])
+        self.assertEqual(mock_post.call_args.kwargs["json"], {"angles": [20.0, 30.0]})
+        self.assertEqual(self.client.total_measurements, 2)
+    
+    @patch('src.api_client.requests.Session.get')
+    @patch('src.api_client.requests.Session.post')
+    def test_measure_many_single_angle_uses_measure(self, mock_post, mock_get):
+        """Test that a one-angle batch is a plain /measure request."""
+        mock_response = Mock()
+        mock_response.json.return_value = 64.0
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        
+        results = self.client.measure_many(np.array([25.0]))
+        
+        np.testing.assert_array_equal(results, [64.0])
+        mock_post.assert_not_called()
+        mock_get.assert_called_once()
+        self.assertEqual(self.client.total_measurements, 1)
+    
+    def test_close(self):
+        """Test closing the client releases the session."""
+        with patch.object(self.client._session, 'close') as mock_close:
+            self.client.close()
+        mock_close.assert_called_once()
+    
     def test_reset_count(self):
         """Test resetting measurement counter."""
         self.client._measurement_count = 10
@@ -23,6 +23,13 @@ class TestGaussianFitter(unittest.TestCase):
         # At the peak (x=mu), should return amplitude
         self.assertAlmostEqual(result[0], 100.0, places=5)
     
+    def test_gaussian_function_scalar(self):
+        """Test the Gaussian function with a scalar angle."""
+        result = self.fitter.gaussian_function(60.0, mu=50, sigma=10, baseline=0, amplitude=100)
+        
+        self.assertEqual(np.ndim(result), 0)
+        self.assertAlmostEqual(float(result), 100.0 * np.exp(-0.5), places=5)
+    
     def test_gaussian_function_at_baseline(self):
         """Test Gaussian function far from peak."""
         x = np.array([0.0])
@@ -50,6 +57,42 @@ class TestGaussianFitter(unittest.TestCase):
         self.assertAlmostEqual(fitted_params.baseline, true_params.baseline, delta=5.0)
         self.assertAlmostEqual(fitted_params.amplitude, true_params.amplitude, delta=5.0)
     
+    def test_gaussian_jac_matches_finite_differences(self):
+        """Test the analytic Jacobian against central finite differences."""
+        x = np.linspace(0, 100, 25)
+        params = np.array([40.0, 12.0, 3.0, 95.0])
+        step = 1e-6
+        
+        jac = self.fitter._gaussian_jac(x, *params)
+        
+        self.assertEqual(jac.shape, (25, 4))
+        for i in range(4):
+            delta = np.zeros(4)
+            delta[i] = step
+            numeric = (self.fitter.gaussian_function(x, *(params + delta))
+                       - self.fitter.gaussian_function(x, *(params - delta))) / (2 * step)
+            np.testing.assert_allclose(jac[:, i], numeric, atol=1e-4)
+    
+    def test_linearized_guess_perfect_data(self):
+        """Test the closed-form estimate on noiseless Gaussian data."""
+        angles = np.linspace(0, 360, 73)
+        measurements = self.fitter.gaussian_function(
+            angles, mu=120, sigma=15, baseline=2, amplitude=98
+        )
+        
+        mu, sigma, baseline, amplitude = self.fitter._linearized_guess(angles, measurements)
+        
+        self.assertAlmostEqual(mu, 120.0, delta=1.0)
+        self.assertAlmostEqual(sigma, 15.0, delta=1.0)
+        self.assertAlmostEqual(amplitude, 98.0, delta=2.0)
+    
+    def test_linearized_guess_flat_data(self):
+        """Test the closed-form estimate rejects data without a peak."""
+        angles = np.linspace(0, 360, 20)
+        measurements = np.full_like(angles, 5.0)
+        
+        self.assertIsNone(self.fitter._linearized_guess(angles, measurements))
+    
     def test_fit_insufficient_data(self):
         """Test fitting with insufficient data points."""
         angles = np.array([10, 20, 30])
@@ -70,6 +113,18 @@ class TestGaussianFitter(unittest.TestCase):
         prediction = self.fitter.predict(0.0, params)
         self.assertLess(prediction, 20.0)
     
+    def test_predict_matches_vectorized_function(self):
+        """Test that scalar prediction agrees with the array Gaussian."""
+        params = GaussianParams(mu=72.5, sigma=8, baseline=3, amplitude=97)
+        angles = np.array([0.0, 60.0, 72.5, 90.0])
+        
+        expected = self.fitter.gaussian_function(
+            angles, params.mu, params.sigma, params.baseline, params.amplitude
+        )
+        predicted = [self.fitter.predict(angle, params) for angle in angles]
+        
+        np.testing.assert_allclose(predicted, expected)
+    
     def test_find_peak(self):
         """Test finding the peak from parameters."""
         params = GaussianParams(mu=123.456, sigma=10, baseline=5, amplitude=100)
@@ -105,6 +160,17 @@ class TestGaussianFitter(unittest.TestCase):
         self.assertAlmostEqual(angles[0], Config.MIN_ANGLE)
         self.assertAlmostEqual(angles[-1], Config.MAX_ANGLE)
     
+    def test_generate_curve_reuses_grid(self):
+        """Test that curve generation shares one read-only angle grid."""
+        params = GaussianParams(mu=50, sigma=10, baseline=5, amplitude=100)
+        
+        first_angles, first_values = self.fitter.generate_curve(params, num_points=50)
+        second_angles, second_values = self.fitter.generate_curve(params, num_points=50)
+        
+        self.assertIs(first_angles, second_angles)
+        self.assertFalse(first_angles.flags.writeable)
+        self.assertIsNot(first_values, second_values)
+    
     def test_fit_with_noisy_data(self):
         """Test fitting with noisy data."""
         # Generate Gaussian data with noise
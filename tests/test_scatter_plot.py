@@ -0,0 +1,137 @@
+"""
+Unit tests for the ResultsPlotter.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from src.calibration import CalibrationResult
+from src.curve_fitting import GaussianParams
+from src import scatter_plot
+from src.scatter_plot import ResultsPlotter
+
+
+def make_result(optimal_angle: float = 50.0) -> CalibrationResult:
+    """Create a small calibration result peaking at `optimal_angle`."""
+    angles = np.arange(0.0, 101.0, 10.0)
+    params = GaussianParams(mu=optimal_angle, sigma=10.0, baseline=2.0, amplitude=100.0)
+    measurements = 2.0 + 98.0 * np.exp(-0.5 * ((angles - optimal_angle) / 10.0) ** 2)
+    return CalibrationResult(
+        optimal_angle=optimal_angle,
+        measured_voltage=99.0,
+        expected_voltage=100.0,
+        total_measurements=angles.size,
+        all_angles=angles,
+        all_measurements=measurements,
+        fitted_params=params,
+        search_result=None
+    )
+
+
+class TestPlotResults(unittest.TestCase):
+    """Test cases for plot reuse through the hash sidecar."""
+    
+    def setUp(self):
+        """Set up a temporary output directory and a drawing spy."""
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_dir.cleanup)
+        
+        patcher = patch.object(ResultsPlotter, '_draw', wraps=ResultsPlotter._draw)
+        self.draw = patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def plot(self, result, **kwargs) -> str:
+        """Plot a result into the temporary directory."""
+        return ResultsPlotter.plot_results(result, self.output_dir.name, 'test_plot', **kwargs)
+    
+    def test_unchanged_result_reuses_plot(self):
+        """Test that plotting the same result again does not redraw it."""
+        result = make_result()
+        
+        first_path = self.plot(result)
+        second_path = self.plot(result)
+        
+        self.assertEqual(second_path, first_path)
+        self.assertEqual(self.draw.call_count, 1)
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir.name, 'test_plot.hash')))
+    
+    def test_changed_result_is_redrawn(self):
+        """Test that a different result is drawn again."""
+        self.plot(make_result(50.0))
+        self.plot(make_result(60.0))
+        
+        self.assertEqual(self.draw.call_count, 2)
+    
+    def test_missing_plot_is_redrawn(self):
+        """Test that a deleted plot file is drawn again."""
+        result = make_result()
+        
+        file_path = self.plot(result)
+        os.remove(file_path)
+        new_path = self.plot(result)
+        
+        self.assertEqual(self.draw.call_count, 2)
+        self.assertTrue(os.path.exists(new_path))
+    
+    def test_format_change_is_redrawn(self):
+        """Test that the same result in another format is drawn again."""
+        result = make_result()
+        
+        self.plot(result, file_format='png')
+        svg_path = self.plot(result, file_format='svg')
+        
+        self.assertEqual(self.draw.call_count, 2)
+        self.assertTrue(svg_path.endswith('.svg'))
+    
+    def test_unsupported_format_rejected(self):
+        """Test that an unknown file format raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.plot(make_result(), file_format='bmp')
+        
+        self.draw.assert_not_called()
+
+
+
+class TestPersistentArtists(unittest.TestCase):
+    """Test cases for reusing the shared figure and its artists."""
+    
+    def setUp(self):
+        """Set up a temporary output directory."""
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_dir.cleanup)
+    
+    def draw(self, result) -> None:
+        """Draw a result on the shared figure."""
+        ResultsPlotter._draw(result, self.output_dir.name, 'test_plot', False, 'png')
+    
+    def test_second_plot_updates_artists(self):
+        """Test that a second result replaces the data of the first one."""
+        self.draw(make_result(50.0))
+        ax = scatter_plot._AX
+        line_count, collection_count = len(ax.lines), len(ax.collections)
+        
+        second = make_result(60.0)
+        self.draw(second)
+        
+        self.assertIs(scatter_plot._AX, ax)
+        self.assertEqual(len(ax.lines), line_count)
+        self.assertEqual(len(ax.collections), collection_count)
+        
+        artists = scatter_plot._ARTISTS
+        np.testing.assert_allclose(
+            artists['scatter'].get_offsets(),
+            np.column_stack((second.all_angles, second.all_measurements))
+        )
+        np.testing.assert_allclose(artists['optimal_line'].get_xdata(), [60.0, 60.0])
+        
+        labels = [text.get_text() for text in ax.get_legend().get_texts()]
+        self.assertIn('Optimal Angle: 60.0°', labels)
+        self.assertIn('Measured: 99.00V', labels)
+        self.assertNotIn('Optimal Angle: 50.0°', labels)
+        self.assertIn('Peak Position (μ): 60.00°', artists['textbox'].get_text())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,8 +3,23 @@ Unit tests for search strategies.
 """
 
 import unittest
-from unittest.mock import Mock
-from src.search_strategy import WideToNarrowSearch, SearchResult
+from unittest.mock import Mock, patch
+import numpy as np
+from src.search_strategy import (
+    AdaptiveSearch, CoarseToFineSearch, GoldenSectionRefiner, MultiPhaseSearch,
+    ScanPhase, WideToNarrowSearch, SearchResult, _angle_grid
+)
+from config import Config
+
+
+def make_mock_client(response):
+    """Create a mock MeasurementClient whose readings are `response(angle)`."""
+    mock_client = Mock()
+    mock_client.measure.side_effect = lambda angle, use_cache=True: response(angle)
+    mock_client.measure_many.side_effect = lambda angles, use_cache=True: np.array(
+        [response(angle) for angle in angles], dtype=float
+    )
+    return mock_client
 
 
 class TestWideToNarrowSearch(unittest.TestCase):
@@ -16,23 +31,16 @@ class TestWideToNarrowSearch(unittest.TestCase):
     
     def test_find_peak_in_results(self):
         """Test finding peak in measurement results."""
-        results = [
-            (10.0, 20.0),
-            (20.0, 50.0),
-            (30.0, 80.0),  # Peak
-            (40.0, 60.0),
-            (50.0, 30.0),
-        ]
+        angles = np.array([10.0, 20.0, 30.0, 40.0, 50.0])
+        measurements = np.array([20.0, 50.0, 80.0, 60.0, 30.0])  # Peak at 30.0
         
-        peak_angle = self.strategy._find_peak_in_results(results)
+        peak_angle = self.strategy._find_peak_in_results(angles, measurements)
         
         self.assertEqual(peak_angle, 30.0)
     
     def test_find_peak_empty_results(self):
         """Test finding peak with no results."""
-        results = []
-        
-        peak_angle = self.strategy._find_peak_in_results(results)
+        peak_angle = self.strategy._find_peak_in_results(np.array([]), np.array([]))
         
         # Should return default middle value
         self.assertEqual(peak_angle, 180.0)
@@ -40,14 +48,13 @@ class TestWideToNarrowSearch(unittest.TestCase):
     def test_search_returns_search_result(self):
         """Test that search returns proper SearchResult."""
         # Create mock client
-        mock_client = Mock()
-        mock_client.measure.return_value = 50.0
+        mock_client = make_mock_client(lambda angle: 50.0)
         
         result = self.strategy.search(mock_client)
         
         self.assertIsInstance(result, SearchResult)
-        self.assertIsInstance(result.angles, list)
-        self.assertIsInstance(result.measurements, list)
+        self.assertIsInstance(result.angles, np.ndarray)
+        self.assertIsInstance(result.measurements, np.ndarray)
         self.assertIsInstance(result.estimated_peak_angle, float)
         self.assertIsInstance(result.total_measurements, int)
     
@@ -59,8 +66,7 @@ class TestWideToNarrowSearch(unittest.TestCase):
             distance_from_peak = abs(angle - 50)
             return max(10, 100 - distance_from_peak * 2)
         
-        mock_client = Mock()
-        mock_client.measure.side_effect = mock_measure
+        mock_client = make_mock_client(mock_measure)
         
         result = self.strategy.search(mock_client)
         
@@ -76,8 +82,7 @@ class TestWideToNarrowSearch(unittest.TestCase):
             distance_from_peak = abs(angle - 100)
             return max(5, 100 - distance_from_peak)
         
-        mock_client = Mock()
-        mock_client.measure.side_effect = mock_measure
+        mock_client = make_mock_client(mock_measure)
         
         result = self.strategy.search(mock_client)
         
@@ -85,14 +90,332 @@ class TestWideToNarrowSearch(unittest.TestCase):
         self.assertAlmostEqual(result.estimated_peak_angle, 100.0, delta=5.0)
 
 
+class TestMultiPhaseSearch(unittest.TestCase):
+    """Test cases for MultiPhaseSearch and its configurations."""
+    
+    @staticmethod
+    def _peak_client(peak):
+        """Create a mock client with a triangular peak at `peak` degrees."""
+        return make_mock_client(lambda angle: max(5, 100 - abs(angle - peak)))
+    
+    def test_phases_without_refiner(self):
+        """Test that a search without refiner stops after the last phase."""
+        strategy = MultiPhaseSearch([ScanPhase("wide", 10.0), ScanPhase("narrow", 1.0, 10.0)])
+        
+        result = strategy.search(self._peak_client(123.0))
+        
+        self.assertAlmostEqual(result.estimated_peak_angle, 123.0, delta=1.0)
+        self.assertEqual(result.total_measurements, len(result.angles))
+    
+    def test_coarse_to_fine_finds_approximate_peak(self):
+        """Test that the coarse-to-fine configuration finds the peak."""
+        result = CoarseToFineSearch().search(self._peak_client(100.0))
+        
+        self.assertIsInstance(result, SearchResult)
+        self.assertAlmostEqual(result.estimated_peak_angle, 100.0, delta=Config.REFINEMENT_STEP)
+    
+    def test_refiner_runs_after_all_phases(self):
+        """Test that every phase runs before the refiner, even on a settled peak."""
+        refiner = Mock()
+        refiner.max_evaluations.return_value = 9
+        refiner.refine.return_value = 100.04
+        strategy = MultiPhaseSearch(
+            [ScanPhase("wide", 10.0), ScanPhase("narrow", 1.0, 10.0)], refiner=refiner
+        )
+        
+        result = strategy.search(self._peak_client(100.0))
+        
+        refiner.refine.assert_called_once()
+        self.assertEqual(result.estimated_peak_angle, 100.04)
+        self.assertTrue(np.any(np.isclose(result.angles, 101.0)))
+    
+    def test_configurations_share_implementation(self):
+        """Test that both configurations are multi-phase searches."""
+        self.assertIsInstance(WideToNarrowSearch(), MultiPhaseSearch)
+        self.assertIsInstance(CoarseToFineSearch(), MultiPhaseSearch)
+        self.assertIsNone(CoarseToFineSearch().refiner)
+
+
+class TestAdaptiveSearch(unittest.TestCase):
+    """Test cases for AdaptiveSearch."""
+    
+    def test_clean_signal_uses_refiner(self):
+        """Test that a clean peak is refined with few measurements."""
+        mock_client = make_mock_client(lambda angle: 2 + 98 * np.exp(-0.5 * ((angle - 123.4) / 10) ** 2))
+        
+        result = AdaptiveSearch().search(mock_client)
+        
+        self.assertAlmostEqual(result.estimated_peak_angle, 123.4, delta=2 * Config.ANGLE_PRECISION)
+        self.assertLess(result.total_measurements, len(CoarseToFineSearch().search(mock_client).angles))
+    
+    def test_noisy_signal_falls_back_to_grid_scans(self):
+        """Test that a peak buried in noise is searched with grid scans."""
+        rng = np.random.default_rng(0)
+        mock_client = make_mock_client(lambda angle: rng.normal(50, 10))
+        
+        result = AdaptiveSearch().search(mock_client)
+        
+        # Grid scans past the wide scan, but no golden-section points
+        wide_count = len(_angle_grid(Config.MIN_ANGLE, Config.MAX_ANGLE, Config.WIDE_SCAN_STEP))
+        self.assertGreater(result.total_measurements, wide_count)
+        np.testing.assert_allclose(result.angles, np.round(result.angles, 1))
+    
+    def test_saturated_peak_gets_fit_window(self):
+        """Test that a flat-topped peak is centered and its flanks scanned."""
+        mock_client = make_mock_client(
+            lambda angle: min(100.0, 2 + 110 * np.exp(-0.5 * ((angle - 123.4) / 10) ** 2))
+        )
+        
+        result = AdaptiveSearch().search(mock_client)
+        
+        # Ties on the flat top end the refinement instead of pushing it to one side
+        self.assertAlmostEqual(result.estimated_peak_angle, 123.4, delta=1.0)
+        window = np.abs(result.angles - result.estimated_peak_angle) <= Config.FINE_WINDOW / 2
+        on_grid = np.isclose(result.angles, np.round(result.angles))
+        self.assertGreaterEqual(np.count_nonzero(window & on_grid), 
+                                int(Config.FINE_WINDOW / Config.NARROW_SCAN_STEP))
+
+
+class TestMeasureAngles(unittest.TestCase):
+    """Test cases for concurrent measurement of a batch of angles."""
+    
+    def test_results_keep_input_order(self):
+        """Test that concurrently measured angles are recorded in order."""
+        mock_client = make_mock_client(lambda angle: 2 * angle)
+        strategy = WideToNarrowSearch()
+        angles = np.arange(0.0, 100.0, 5.0)
+        
+        measured_angles, measurements = strategy._measure_angles(mock_client, angles)
+        
+        np.testing.assert_array_equal(measured_angles, angles)
+        np.testing.assert_array_equal(measurements, 2 * angles)
+        np.testing.assert_array_equal(strategy.angles, angles)
+    
+    def test_disabled_cache_takes_fresh_readings(self):
+        """Test that with the memo off, repeated angles are re-measured and recorded."""
+        mock_client = make_mock_client(lambda angle: 2 * angle)
+        strategy = WideToNarrowSearch()
+        
+        with patch.object(Config, 'SEARCH_CACHE_ENABLED', False):
+            strategy._measure_angles(mock_client, np.array([10.0, 20.0]))
+            strategy._measure_angles(mock_client, np.array([20.0, 30.0]))
+        
+        for call in mock_client.measure_many.call_args_list:
+            self.assertFalse(call.kwargs["use_cache"])
+        np.testing.assert_array_equal(strategy.angles, [10.0, 20.0, 20.0, 30.0])
+    
+    def test_repeated_search_measures_again(self):
+        """Test that a second search does not reuse the first one's readings."""
+        mock_client = make_mock_client(lambda angle: 100 - abs(angle - 100))
+        strategy = WideToNarrowSearch()
+        
+        first = strategy.search(mock_client)
+        calls = mock_client.measure_many.call_count
+        second = strategy.search(mock_client)
+        
+        self.assertEqual(mock_client.measure_many.call_count, 2 * calls)
+        self.assertEqual(second.total_measurements, first.total_measurements)
+        np.testing.assert_array_equal(second.angles, first.angles)
+    
+    def test_angles_measured_in_one_batch(self):
+        """Test that a grid of new angles is sent to the client in one call."""
+        mock_client = make_mock_client(lambda angle: 2 * angle)
+        strategy = WideToNarrowSearch()
+        
+        strategy._measure_angles(mock_client, np.arange(0.0, 100.0, 5.0))
+        
+        mock_client.measure_many.assert_called_once()
+        mock_client.measure.assert_not_called()
+    
+    def test_failed_angles_are_skipped(self):
+        """Test that a failing angle is reported and left out of the results."""
+        def measure(angle):
+            if angle == 20.0:
+                raise RuntimeError("timeout")
+            return angle
+        mock_client = make_mock_client(measure)
+        strategy = WideToNarrowSearch()
+        
+        with self.assertLogs('src.search_strategy', level='WARNING') as logs:
+            angles, measurements = strategy._measure_angles(
+                mock_client, np.array([10.0, 20.0, 30.0])
+            )
+        
+        self.assertIn("Failed to measure at 20.0", logs.output[-1])
+        np.testing.assert_array_equal(angles, [10.0, 30.0])
+        np.testing.assert_array_equal(measurements, [10.0, 30.0])
+        np.testing.assert_array_equal(strategy.angles, [10.0, 30.0])
+    
+    def test_repeated_angles_are_reused(self):
+        """Test that angles measured by an earlier phase are not measured again."""
+        mock_client = make_mock_client(lambda angle: 2 * angle)
+        strategy = WideToNarrowSearch()
+        
+        strategy._measure_angles(mock_client, np.array([10.0, 20.0]))
+        angles, measurements = strategy._measure_angles(
+            mock_client, np.array([20.0, 20.04, 30.0])
+        )
+        
+        np.testing.assert_array_equal(angles, [20.0, 20.04, 30.0])
+        np.testing.assert_array_equal(measurements, [40.0, 40.0, 60.0])
+        measured = [angle for call in mock_client.measure_many.call_args_list for angle in call.args[0]]
+        self.assertEqual(measured, [10.0, 20.0, 30.0])
+        np.testing.assert_array_equal(strategy.angles, [10.0, 20.0, 30.0])
+
+
+class TestRunPhase(unittest.TestCase):
+    """Test cases for window scan phases."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.strategy = WideToNarrowSearch()
+        self.phase = ScanPhase("narrow", 1.0, 10.0)
+    
+    def test_window_measured_in_one_batch(self):
+        """Test that the whole window is measured with a single batch."""
+        mock_client = make_mock_client(lambda angle: 100 - abs(angle - 100))
+        
+        angles, measurements = self.strategy._run_phase(mock_client, self.phase, 100.0)
+        
+        self.assertEqual(len(angles), 11)
+        self.assertEqual(mock_client.measure_many.call_count, 1)
+        self.assertEqual(self.strategy._find_peak_in_results(angles, measurements), 100.0)
+    
+    def test_window_finds_offset_peak(self):
+        """Test that a peak away from the window center is found."""
+        mock_client = make_mock_client(lambda angle: 100 - abs(angle - 104))
+        
+        angles, measurements = self.strategy._run_phase(mock_client, self.phase, 100.0)
+        
+        self.assertEqual(len(angles), 11)
+        self.assertEqual(self.strategy._find_peak_in_results(angles, measurements), 104.0)
+    
+    def test_window_clipped_to_angle_range(self):
+        """Test that the window does not extend past the angle limits."""
+        mock_client = make_mock_client(lambda angle: 100 - abs(angle - 1))
+        
+        angles, _ = self.strategy._run_phase(mock_client, self.phase, 1.0)
+        
+        self.assertGreaterEqual(angles.min(), Config.MIN_ANGLE)
+        self.assertEqual(len(angles), 7)
+
+
+class TestSearchHistory(unittest.TestCase):
+    """Test cases for the array-backed search history."""
+    
+    def test_history_sized_for_search(self):
+        """Test that one search fits in the preallocated history buffers."""
+        mock_client = make_mock_client(lambda angle: 100 - abs(angle - 100))
+        strategy = CoarseToFineSearch()
+        capacity = strategy._angles.size
+        
+        result = strategy.search(mock_client)
+        
+        self.assertLessEqual(result.total_measurements, capacity)
+        self.assertEqual(strategy._angles.size, capacity)
+    
+    def test_history_grows_past_initial_capacity(self):
+        """Test that recording more points than the buffer holds keeps all data."""
+        strategy = WideToNarrowSearch()
+        count = 3 * strategy._angles.size + 1
+        
+        for i in range(count):
+            strategy._record(np.array([float(i)]), np.array([float(2 * i)]))
+        
+        np.testing.assert_array_equal(strategy.angles, np.arange(count))
+        np.testing.assert_array_equal(strategy.measurements, 2 * np.arange(count))
+    
+    def test_history_records_large_block(self):
+        """Test that a block larger than twice the buffer is recorded whole."""
+        strategy = WideToNarrowSearch()
+        angles = np.arange(5.0 * strategy._angles.size)
+        
+        strategy._record(angles[:1], 2 * angles[:1])
+        strategy._record(angles[1:], 2 * angles[1:])
+        
+        np.testing.assert_array_equal(strategy.angles, angles)
+        np.testing.assert_array_equal(strategy.measurements, 2 * angles)
+
+
+class TestGoldenSectionRefiner(unittest.TestCase):
+    """Test cases for GoldenSectionRefiner."""
+    
+    def test_refine_converges_to_peak(self):
+        """Test that refinement locates the peak within tolerance."""
+        evaluated = []
+        
+        def measure(angle):
+            evaluated.append(angle)
+            return 100 - (angle - 50.37) ** 2
+        
+        refiner = GoldenSectionRefiner(window=2.0, tolerance=0.1)
+        peak = refiner.refine(measure, 50.0)
+        
+        self.assertAlmostEqual(peak, 50.37, delta=0.1)
+        # Far fewer measurements than the 21-point grid over the same window
+        self.assertLessEqual(len(evaluated), 10)
+        self.assertTrue(all(49.0 <= angle <= 51.0 for angle in evaluated))
+    
+    def test_refine_stops_within_noise(self):
+        """Test that readings closer than the noise level end the search."""
+        evaluated = []
+        
+        def measure(angle):
+            evaluated.append(angle)
+            return 100 - (angle - 50.37) ** 2
+        
+        peak = GoldenSectionRefiner(window=2.0, tolerance=0.1).refine(measure, 50.0, noise=1.0)
+        
+        self.assertEqual(len(evaluated), 2)
+        self.assertAlmostEqual(peak, 50.0)
+    
+    def test_refine_stays_in_valid_range(self):
+        """Test that the bracket is clipped to the valid angle range."""
+        evaluated = []
+        
+        def measure(angle):
+            evaluated.append(angle)
+            return -angle
+        
+        peak = GoldenSectionRefiner(window=2.0, tolerance=0.1).refine(measure, 0.0)
+        
+        self.assertLess(peak, 0.1)
+        self.assertTrue(all(angle >= Config.MIN_ANGLE for angle in evaluated))
+
+
+class TestAngleGrid(unittest.TestCase):
+    """Test cases for the cached angle grid helper."""
+    
+    def test_grid_is_shared(self):
+        """Test that grids with the same step are views of one array."""
+        first = _angle_grid(Config.MIN_ANGLE, Config.MAX_ANGLE, Config.WIDE_SCAN_STEP)
+        second = _angle_grid(100.0, 150.0, Config.WIDE_SCAN_STEP)
+        
+        self.assertTrue(np.shares_memory(first, second))
+        self.assertFalse(second.flags.writeable)
+        self.assertEqual(list(second), [100.0, 110.0, 120.0, 130.0, 140.0, 150.0])
+    
+    def test_grid_includes_bounds_despite_rounding(self):
+        """Test that bounds hit by floating-point steps are included."""
+        grid = _angle_grid(99.9, 100.3, Config.REFINEMENT_STEP)
+        
+        np.testing.assert_allclose(grid, [99.9, 100.0, 100.1, 100.2, 100.3])
+    
+    def test_grid_clipped_to_valid_range(self):
+        """Test that grid angles stay within the valid angle range."""
+        grid = _angle_grid(350.0, 370.0, 5.0)
+        
+        self.assertEqual(list(grid), [350.0, 355.0, 360.0])
+
+
 class TestSearchResult(unittest.TestCase):
     """Test cases for SearchResult dataclass."""
     
     def test_search_result_creation(self):
         """Test creating a SearchResult."""
         result = SearchResult(
-            angles=[10.0, 20.0, 30.0],
-            measurements=[50.0, 75.0, 60.0],
+            angles=np.array([10.0, 20.0, 30.0]),
+            measurements=np.array([50.0, 75.0, 60.0]),
             estimated_peak_angle=20.0,
             total_measurements=3
         )
@@ -101,6 +424,20 @@ class TestSearchResult(unittest.TestCase):
         self.assertEqual(len(result.measurements), 3)
         self.assertEqual(result.estimated_peak_angle, 20.0)
         self.assertEqual(result.total_measurements, 3)
+    
+    def test_search_result_owns_arrays(self):
+        """Test that a search result is not changed by later measurements."""
+        strategy = WideToNarrowSearch()
+        mock_client = make_mock_client(lambda angle: 100 - abs(angle - 100))
+        
+        result = strategy.search(mock_client)
+        angles = result.angles.copy()
+        result.angles[0] = -1.0
+        strategy._record(np.array([1.5]), np.array([2.5]))
+        
+        self.assertTrue(result.angles.flags.owndata)
+        self.assertEqual(strategy.angles[0], angles[0])
+        self.assertEqual(len(result.angles), len(angles))
 
 
 if __name__ == '__main__':